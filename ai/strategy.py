@@ -1,7 +1,9 @@
 from abc import ABC, abstractmethod
 from typing import Any, List, Dict, Protocol, Callable, Optional
+import functools
 import logging
 import random
+from models.actions import combatant_name
 from models.spells import SpellAction
 
 # Constants for AI behavior tuning
@@ -35,6 +37,18 @@ AGGRESSIVE_SPELL_ROUNDS = 5
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=4096)
+def _strategy_roll(seed: int) -> float:
+    """
+    First draw of the targeting RNG for a seed.
+
+    Seeds depend only on monster name and round, so every run of a batch
+    shares the same rolls; computing each one once skips re-seeding the
+    generator for every monster turn of every run.
+    """
+    return random.Random(seed).random()
+
+
 class Combatant(Protocol):
     """Protocol defining the interface for combatants in combat."""
     name: str
@@ -66,10 +80,23 @@ class AIStrategy(ABC):
     """
 
     def __init__(self):
-        """Initialize the AI strategy with a random number generator."""
-        self.rng = random.Random()
+        """Initialize the AI strategy; its random number generator is created on first use."""
+        self._rng = None
         logger.debug(f"Initialized {self.__class__.__name__}")
 
+    @property
+    def rng(self) -> random.Random:
+        """
+        Random number generator for this strategy.
+
+        Created lazily: every combat builds a strategy per combatant, seeding a
+        Random from os.urandom is a sizeable part of that, and most strategies
+        never draw from it.
+        """
+        if self._rng is None:
+            self._rng = random.Random()
+        return self._rng
+
     @abstractmethod
     def choose_action(self, combatant: Any, combat_state: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -325,7 +352,7 @@ class PartyAIStrategy(AIStrategy):
         spell_action = SpellAction(spell)
 
         priority = "CRITICAL" if is_critical else "LOW HP"
-        logger.info(f"[PartyAI] {combatant.name} heals {target.name} ({priority}) with {spell.name}")
+        logger.debug(f"[PartyAI] {combatant.name} heals {target.name} ({priority}) with {spell.name}")
 
         return {'type': 'cast_spell', 'spell': spell_action, 'target': target}
 
@@ -427,7 +454,7 @@ class PartyAIStrategy(AIStrategy):
             # If this is a concentration buff, check if caster is already concentrating on it
             if is_concentration:
                 # Check if any ally (including caster) already has this concentration buff from this caster
-                caster_name = getattr(combatant, 'name', str(combatant))
+                caster_name = combatant_name(combatant)
                 already_concentrating = False
 
                 for ally in allies:
@@ -472,9 +499,9 @@ class PartyAIStrategy(AIStrategy):
                 # Log differently for multi-target spells
                 if len(targets_to_buff) > 1:
                     target_names = ", ".join([t.name for t in targets_to_buff])
-                    logger.info(f"[PartyAI] {combatant.name} casts buff {spell.name} on {target_names}")
+                    logger.debug(f"[PartyAI] {combatant.name} casts buff {spell.name} on {target_names}")
                 else:
-                    logger.info(f"[PartyAI] {combatant.name} casts buff {spell.name} on {targets_to_buff[0].name}")
+                    logger.debug(f"[PartyAI] {combatant.name} casts buff {spell.name} on {targets_to_buff[0].name}")
 
                 return {'type': 'cast_spell', 'spell': spell_action, 'target': target}
 
@@ -568,11 +595,11 @@ class PartyAIStrategy(AIStrategy):
                     # Target all enemies with area effect spells
                     target = enemies
                     target_names = ", ".join([e.name for e in enemies])
-                    logger.info(f"[PartyAI] {combatant.name} aggressively casts AoE {best_spell.name} (lvl {best_spell.level}) targeting {target_names}")
+                    logger.debug(f"[PartyAI] {combatant.name} aggressively casts AoE {best_spell.name} (lvl {best_spell.level}) targeting {target_names}")
                 else:
                     # Single target spell
                     target = dangerous
-                    logger.info(f"[PartyAI] {combatant.name} aggressively casts {best_spell.name} (lvl {best_spell.level}) vs {dangerous.name}")
+                    logger.debug(f"[PartyAI] {combatant.name} aggressively casts {best_spell.name} (lvl {best_spell.level}) vs {dangerous.name}")
 
                 return {'type': 'cast_spell', 'spell': spell_action, 'target': target}
 
@@ -586,7 +613,7 @@ class PartyAIStrategy(AIStrategy):
 
             if spell_attacks:
                 best_spell = max(spell_attacks, key=lambda a: a.hit_bonus(combatant))
-                logger.info(f"[PartyAI] {combatant.name} uses {best_spell.name} vs {dangerous.name}")
+                logger.debug(f"[PartyAI] {combatant.name} uses {best_spell.name} vs {dangerous.name}")
                 return {'type': 'attack', 'action': best_spell, 'target': dangerous}
 
         # Try attack actions
@@ -598,7 +625,7 @@ class PartyAIStrategy(AIStrategy):
         if attack_actions:
             best_action = max(attack_actions, key=lambda a: a.hit_bonus(combatant))
             best_bonus = best_action.hit_bonus(combatant)
-            logger.info(f"[PartyAI] {combatant.name} attacks with {best_action.name} (+{best_bonus}) vs {dangerous.name}")
+            logger.debug(f"[PartyAI] {combatant.name} attacks with {best_action.name} (+{best_bonus}) vs {dangerous.name}")
             return {'type': 'attack', 'action': best_action, 'target': dangerous}
 
         # Try damaging spells as last resort
@@ -619,11 +646,11 @@ class PartyAIStrategy(AIStrategy):
                 # Target all enemies with area effect spells
                 target = enemies
                 target_names = ", ".join([e.name for e in enemies])
-                logger.info(f"[PartyAI] {combatant.name} casts AoE {spell.name} targeting {target_names}")
+                logger.debug(f"[PartyAI] {combatant.name} casts AoE {spell.name} targeting {target_names}")
             else:
                 # Single target spell
                 target = dangerous
-                logger.info(f"[PartyAI] {combatant.name} casts {spell.name} vs {dangerous.name}")
+                logger.debug(f"[PartyAI] {combatant.name} casts {spell.name} vs {dangerous.name}")
 
             return {'type': 'cast_spell', 'spell': spell_action, 'target': target}
 
@@ -751,10 +778,10 @@ class MonsterAIStrategy(AIStrategy):
                 if getattr(special_action, 'area_effect', False):
                     target = enemies
                     target_names = ", ".join([e.name for e in enemies])
-                    logger.info(f"[MonsterAI] {combatant.name} uses AoE special ability: {special_action.name} targeting {target_names}")
+                    logger.debug(f"[MonsterAI] {combatant.name} uses AoE special ability: {special_action.name} targeting {target_names}")
                 else:
                     target = self.evaluate_targets(combatant, enemies, combat_state)[0]
-                    logger.info(f"[MonsterAI] {combatant.name} uses special ability: {special_action.name} vs {target.name}")
+                    logger.debug(f"[MonsterAI] {combatant.name} uses special ability: {special_action.name} vs {target.name}")
                 return {'type': 'special', 'action': special_action, 'target': target}
 
             # Priority 2: Select target using varied strategy
@@ -772,9 +799,9 @@ class MonsterAIStrategy(AIStrategy):
                 if getattr(attack_action, 'area_effect', False):
                     target = enemies
                     target_names = ", ".join([e.name for e in enemies])
-                    logger.info(f"[MonsterAI] {combatant.name} uses AoE attack: {attack_action.name} targeting {target_names}")
+                    logger.debug(f"[MonsterAI] {combatant.name} uses AoE attack: {attack_action.name} targeting {target_names}")
                 else:
-                    logger.info(f"[MonsterAI] {combatant.name} attacks {target.name}")
+                    logger.debug(f"[MonsterAI] {combatant.name} attacks {target.name}")
                 return {'type': 'attack', 'action': attack_action, 'target': target}
 
             # Default: wait if no attack actions
@@ -827,9 +854,7 @@ class MonsterAIStrategy(AIStrategy):
         round_num = combat_state.get('round', 1)
         seed = sum(ord(c) for c in monster_name) + round_num * 13
 
-        # Use instance RNG with deterministic seed
-        self.rng.seed(seed)
-        strategy_roll = self.rng.random()
+        strategy_roll = _strategy_roll(seed)
 
         # Select targeting strategy based on roll
         if strategy_roll < SPREAD_DAMAGE_PROBABILITY:
@@ -851,13 +876,12 @@ class MonsterAIStrategy(AIStrategy):
             logger.debug(f"[MonsterAI] {combatant.name} finishes weak target {target.name}")
 
         else:
-            # Random targeting for unpredictability
+            # Random targeting for unpredictability; continues the seeded stream behind strategy_roll
+            self.rng.seed(seed)
+            self.rng.random()
             target = self.rng.choice(enemies)
             logger.debug(f"[MonsterAI] {combatant.name} randomly targets {target.name}")
 
-        # Reset seed to avoid affecting other random operations
-        self.rng.seed()
-
         return target
 
     def evaluate_targets(self, combatant: Any, potential_targets: List[Any], combat_state: Dict[str, Any]) -> List[Any]:
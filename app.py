@@ -10,16 +10,18 @@ import json
 import logging
 import os
 import re
+import secrets
 import time
+from collections.abc import Mapping
 from datetime import timedelta
 from typing import Dict, Any, Tuple, List, Optional
-from uuid import uuid4
 
 # Third-party imports
 from flask import (
     Flask, Response, render_template, request, redirect,
-    url_for, session, jsonify, flash
+    url_for, session, jsonify, flash, stream_with_context
 )
+from flask_caching import Cache
 from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
 
@@ -29,6 +31,7 @@ from controllers.encounter_controller import EncounterController
 from controllers.results_controller import ResultsController
 from controllers.simulation_controller import SimulationController
 from models.db import DatabaseManager
+from models.spell_manager import SpellManager
 from utils.exceptions import (
     AppError, ValidationError
 )
@@ -51,16 +54,55 @@ RATE_LIMIT_API_BALANCE = "50 per minute"
 RATE_LIMIT_RESULTS_DETAILED = "50 per minute"
 RATE_LIMIT_RESULTS_STATS = "50 per minute"
 RATE_LIMIT_RESULTS_EXPORT = "20 per minute"
+# Per-process memory:// by default; point at Redis (redis://host:6379/0) so
+# all gunicorn workers share one set of counters
+RATE_LIMIT_STORAGE_URI = os.environ.get('LIMITER_STORAGE_URI', 'memory://')
+
+# Constants - Caching
+RESULTS_CACHE_TIMEOUT = 3600  # Saved simulations never change; bound memory use instead
+TEMPLATES_CACHE_TIMEOUT = 0  # Cache static encounter templates until restart
 
 # Constants - Input Validation
 MAX_INPUT_LENGTH_DEFAULT = 1000
 MAX_INPUT_LENGTH_JSON = 5000
+MAX_JSON_BODY_BYTES = MAX_INPUT_LENGTH_JSON * 100
 MIN_BATCH_RUNS = 1
 MAX_BATCH_RUNS = 1000
+# Start batch worker processes at boot instead of on the first large batch
+BATCH_POOL_PREWARM = os.environ.get('BATCH_POOL_PREWARM', 'false').lower() == 'true'
+
+# Constants - HTML Sanitization
+DANGEROUS_TAGS = ('script', 'iframe', 'object', 'embed', 'form', 'input', 'style', 'link')
+DANGEROUS_ATTRS = ('onclick', 'onerror', 'onload', 'onmouseover', 'onfocus', 'onblur')
+
+# Precompiled patterns - Input Validation
+CR_PATTERN = re.compile(r'^[0-9/]+$')
+TEMPLATE_NAME_PATTERN = re.compile(r'^[a-zA-Z0-9\s\'\-_.,!?()]+$')
+DEFAULT_FIELD_PATTERN = re.compile(r'^[a-zA-Z0-9\s\-_.,!?()]+$')
+
+# Precompiled patterns - HTML Sanitization (one alternation per pass)
+_DANGEROUS_TAG_NAMES = '|'.join(DANGEROUS_TAGS)
+DANGEROUS_TAG_PAIR_PATTERN = re.compile(
+    f'<({_DANGEROUS_TAG_NAMES})\\b[^>]*>.*?</\\1\\s*>', re.IGNORECASE | re.DOTALL
+)
+# Leftover openers and stray closing tags such as </script >
+DANGEROUS_TAG_OPEN_PATTERN = re.compile(f'</?(?:{_DANGEROUS_TAG_NAMES})\\b[^>]*>', re.IGNORECASE)
+# Quoted (with matching quotes) or unquoted attribute values
+DANGEROUS_ATTR_PATTERN = re.compile(
+    f'\\b(?:{"|".join(DANGEROUS_ATTRS)})\\s*=\\s*(?:"[^"]*"|\'[^\']*\'|[^\\s>]+)', re.IGNORECASE
+)
+JAVASCRIPT_PROTOCOL_PATTERN = re.compile(r'javascript\s*:', re.IGNORECASE)
+LOG_ENTRY_SEPARATOR = '\x1e'  # ASCII record separator; escaped by repr() in log entries
+
+# Constants - Export
+EXPORT_JSON_SEPARATORS = (',', ':')
 
 # Constants - File Paths
 ENCOUNTER_TEMPLATES_FILE = 'data/encounter_templates.json'
 
+# Constants - Sessions
+SESSIONLESS_ENDPOINTS = frozenset({'healthz', 'favicon', 'static'})
+
 # Constants - Default Values
 DEFAULT_PARTY_ID = 1
 DEFAULT_PARTY_LEVEL = 5
@@ -105,43 +147,70 @@ def configure_app(app: Flask) -> None:
 
 configure_app(app)
 
+def preload_templates(app: Flask) -> None:
+    """
+    Compile every template into the Jinja cache at startup.
+
+    TEMPLATES_AUTO_RELOAD is left unset so Flask decides reloading from the
+    debug flag, including one set later by app.run(debug=True). Outside
+    debug mode cached templates are never re-checked on disk, so the first
+    request to each page skips compilation and later renders skip the
+    mtime stat.
+
+    Args:
+        app: Flask application instance
+    """
+    for name in app.jinja_env.list_templates(extensions=['html']):
+        app.jinja_env.get_template(name)
+
+preload_templates(app)
+
 # Initialize rate limiting
 limiter = Limiter(
     app=app,
     key_func=get_remote_address,
     default_limits=[RATE_LIMIT_PER_DAY, RATE_LIMIT_PER_HOUR],
-    storage_uri="memory://"
+    storage_uri=RATE_LIMIT_STORAGE_URI
 )
 
+# Initialize response caching
+cache = Cache(app, config={
+    'CACHE_TYPE': 'SimpleCache',
+    'CACHE_DEFAULT_TIMEOUT': RESULTS_CACHE_TIMEOUT
+})
+
 # Initialize controllers
 db = DatabaseManager()
+spell_manager = SpellManager()
 encounter_controller = EncounterController()
-simulation_controller = SimulationController()
-batch_simulation_controller = BatchSimulationController()
-results_controller = ResultsController()
+simulation_controller = SimulationController(db=db, spell_manager=spell_manager)
+batch_simulation_controller = BatchSimulationController(db=db, spell_manager=spell_manager)
+if BATCH_POOL_PREWARM:
+    batch_simulation_controller.warm_up()
+results_controller = ResultsController(db=db)
 
 # Helper Functions
 
 def validate_input(
-    data: Dict[str, Any],
+    data: Mapping[str, Any],
     allowed_fields: Optional[List[str]] = None,
     max_length: int = MAX_INPUT_LENGTH_DEFAULT
-) -> Dict[str, Any]:
+) -> Mapping[str, Any]:
     """
     Validate and sanitize input data.
 
     Args:
-        data: Dictionary of input data to validate
+        data: Mapping of input data to validate (a dict or request.form)
         allowed_fields: Optional list of allowed field names
         max_length: Maximum string length for validation
 
     Returns:
-        Validated data dictionary
+        The validated mapping, unchanged
 
     Raises:
         ValidationError: If validation fails
     """
-    if not isinstance(data, dict):
+    if not isinstance(data, Mapping):
         raise ValidationError("Invalid input format")
 
     if allowed_fields:
@@ -155,14 +224,14 @@ def validate_input(
         if isinstance(value, str):
             if key == 'cr':
                 # Allow numbers, fractions, and slash for CR
-                if not re.match(r'^[0-9/]+$', value):
+                if not CR_PATTERN.match(value):
                     raise ValidationError(f"Invalid characters in field {key}")
             elif key == 'template_name':
                 # Allow letters, numbers, spaces, apostrophes, and common punctuation for template names
-                if not re.match(r'^[a-zA-Z0-9\s\'\-_.,!?()]+$', value):
+                if not TEMPLATE_NAME_PATTERN.match(value):
                     raise ValidationError(f"Invalid characters in field {key}")
             else:
-                if not re.match(r'^[a-zA-Z0-9\s\-_.,!?()]+$', value):
+                if not DEFAULT_FIELD_PATTERN.match(value):
                     raise ValidationError(f"Invalid characters in field {key}")
 
     return data
@@ -182,22 +251,163 @@ def sanitize_html(text: Any) -> str:
     if not isinstance(text, str):
         return str(text)
 
-    # Remove potentially dangerous HTML tags
-    dangerous_tags = ['script', 'iframe', 'object', 'embed', 'form', 'input', 'style', 'link']
-    for tag in dangerous_tags:
-        text = re.sub(f'<{tag}[^>]*>.*?</{tag}>', '', text, flags=re.IGNORECASE | re.DOTALL)
-        text = re.sub(f'<{tag}[^>]*>', '', text, flags=re.IGNORECASE)
+    # Fast path: nothing below can match without a tag, an attribute
+    # assignment or a javascript: protocol
+    if '<' not in text and '=' not in text and 'javascript' not in text.lower():
+        return text
+
+    # Remove potentially dangerous HTML tags (paired, then any leftover openers)
+    text = DANGEROUS_TAG_PAIR_PATTERN.sub('', text)
+    text = DANGEROUS_TAG_OPEN_PATTERN.sub('', text)
 
     # Remove dangerous attributes (event handlers)
-    dangerous_attrs = ['onclick', 'onerror', 'onload', 'onmouseover', 'onfocus', 'onblur']
-    for attr in dangerous_attrs:
-        text = re.sub(f'{attr}\\s*=\\s*["\'][^"\']*["\']', '', text, flags=re.IGNORECASE)
+    text = DANGEROUS_ATTR_PATTERN.sub('', text)
 
     # Remove javascript: protocol
-    text = re.sub(r'javascript:', '', text, flags=re.IGNORECASE)
+    text = JAVASCRIPT_PROTOCOL_PATTERN.sub('', text)
 
     return text
 
+def sanitize_html_batch(entries: List[Any]) -> List[str]:
+    """
+    Sanitize a list of log entries with a single pass of each pattern.
+
+    Entries are joined with LOG_ENTRY_SEPARATOR, sanitized once and split
+    again. If a match spans an entry boundary the separator count changes,
+    and the entries are sanitized one by one instead, so the result is
+    always the same as calling sanitize_html on each entry.
+
+    Args:
+        entries: Log entries to sanitize (converted with str())
+
+    Returns:
+        List of sanitized strings, one per entry
+    """
+    texts = [str(entry) for entry in entries]
+    if not texts:
+        return []
+
+    sanitized = sanitize_html(LOG_ENTRY_SEPARATOR.join(texts)).split(LOG_ENTRY_SEPARATOR)
+    if len(sanitized) != len(texts):
+        return [sanitize_html(text) for text in texts]
+    return sanitized
+
+def read_json_body() -> Any:
+    """
+    Read and parse the JSON request body.
+
+    Parses the raw body directly instead of going through request.get_json(),
+    so the body is not cached on the request after parsing. Oversized bodies
+    are refused before they are read into memory.
+
+    Returns:
+        Parsed JSON value, or an empty dict if the body is empty
+
+    Raises:
+        ValidationError: If the body exceeds MAX_JSON_BODY_BYTES
+        ValueError: If the body is not valid JSON
+    """
+    content_length = request.content_length
+    if content_length is not None and content_length > MAX_JSON_BODY_BYTES:
+        raise ValidationError("Request body too large")
+    # Read one byte past the limit so a body sent without a length is bounded too
+    raw = request.stream.read(MAX_JSON_BODY_BYTES + 1)
+    if not raw:
+        return {}
+    if len(raw) > MAX_JSON_BODY_BYTES:
+        raise ValidationError("Request body too large")
+    return json.loads(raw) or {}
+
+def resolve_simulation_id() -> Optional[int]:
+    """
+    Resolve which simulation a results request refers to.
+
+    Checks, cheapest first: the sim_id query parameter, the session, the
+    in-memory simulation state, and finally the newest saved simulation
+    for this session in the database.
+
+    Returns:
+        Simulation ID, or None if this session has no simulations
+
+    Raises:
+        ValidationError: If simulation ID is invalid
+    """
+    sim_id = request.args.get('sim_id', type=int) or session.get('simulation_id')
+    if sim_id and sim_id < 0:
+        raise ValidationError("Invalid simulation ID")
+    if sim_id:
+        return sim_id
+
+    session_id = session['session_id']
+    sim_id = simulation_controller.get_simulation_id(session_id)
+    if sim_id:
+        return sim_id
+
+    try:
+        return db.get_last_simulation_id(session_id)
+    except Exception as e:
+        logger.error(f"Failed to get simulation ID from database: {e}")
+        log_exception(e)
+        return None
+
+# Cached Data Access
+# Only non-empty results are cached so a simulation that has not been
+# saved yet is looked up again on the next request.
+
+@cache.memoize(response_filter=lambda rv: bool(rv['simulation']['id']))
+def get_simulation_results(sim_id: int) -> Dict[str, Any]:
+    """
+    Get formatted simulation results (cached per simulation ID).
+
+    Args:
+        sim_id: Simulation ID
+
+    Returns:
+        Dictionary with simulation summary and combat logs
+    """
+    return results_controller.format_simulation_results(sim_id)
+
+@cache.memoize(response_filter=lambda rv: bool(rv['simulation']['id']))
+def get_results_bundle(sim_id: int) -> Dict[str, Any]:
+    """
+    Get simulation summary, logs and statistics in one lookup (cached per simulation ID).
+
+    Args:
+        sim_id: Simulation ID
+
+    Returns:
+        Dictionary with simulation summary, combat logs and statistics
+    """
+    return results_controller.get_results_bundle(sim_id)
+
+@cache.memoize(response_filter=bool)
+def get_combat_statistics(sim_id: int) -> List[Dict[str, Any]]:
+    """
+    Get combat statistics (cached per simulation ID).
+
+    Args:
+        sim_id: Simulation ID
+
+    Returns:
+        List of per-combatant statistics dictionaries
+    """
+    return results_controller.generate_combat_statistics(sim_id)
+
+@cache.memoize(timeout=TEMPLATES_CACHE_TIMEOUT)
+def load_prebuilt_templates() -> List[Dict[str, Any]]:
+    """
+    Load prebuilt encounter templates from disk (cached).
+
+    Returns:
+        List of encounter template dictionaries
+
+    Raises:
+        FileNotFoundError: If the templates file is missing
+        json.JSONDecodeError: If the templates file is invalid
+    """
+    with open(ENCOUNTER_TEMPLATES_FILE, 'r', encoding='utf-8') as f:
+        return json.load(f)["encounters"]
+
 def load_party_from_session() -> Tuple[List[Any], int]:
     """
     Load party data from session.
@@ -231,7 +441,7 @@ def load_monsters_from_session() -> List[Any]:
     Returns:
         List of monster dictionaries
     """
-    return session.get('encounter_monsters', [])
+    return encounter_controller.get_current_encounter_monsters()
 
 # Security Headers
 
@@ -258,6 +468,23 @@ def add_security_headers(response: Response) -> Response:
     )
     return response
 
+# Database Connection Scope
+
+@app.before_request
+def open_db_scope() -> None:
+    """Share one SQLite connection across all queries made by this request."""
+    db.begin_request_scope()
+
+@app.teardown_appcontext
+def close_db_scope(exc: Optional[BaseException]) -> None:
+    """
+    Close the request-scoped SQLite connection.
+
+    Args:
+        exc: Exception that ended the request, if any
+    """
+    db.end_request_scope()
+
 # Session Management
 
 @app.before_request
@@ -265,17 +492,17 @@ def ensure_session() -> None:
     """
     Ensure session ID exists before processing requests.
 
-    Creates a new session ID and database session if one doesn't exist.
+    Only allocates the ID; the database row is created by the endpoints
+    that write session-owned data (party selection, simulations, batches).
     """
+    if request.endpoint in SESSIONLESS_ENDPOINTS:
+        return
+
     if 'session_id' not in session:
         session.permanent = True  # Make session persistent across requests
-        session['session_id'] = str(uuid4())
-        try:
-            db.create_session(session['session_id'])
-            logger.info(f"Created new session: {session['session_id']}")
-        except Exception as e:
-            logger.error(f"Failed to create database session: {e}")
-            log_exception(e)
+        # token_hex skips UUID object construction and hyphenated formatting
+        session['session_id'] = secrets.token_hex(16)
+        logger.info("Created new session: %s", session['session_id'])
     else:
         session.permanent = True  # Ensure existing sessions are also permanent
 
@@ -314,7 +541,7 @@ def party() -> str:
         # Validate party selection
         try:
             party_data = validate_input(
-                request.form.to_dict(),
+                request.form,
                 allowed_fields=['party_id', 'party_level']
             )
             selected_party_id = int(party_data.get('party_id', DEFAULT_PARTY_ID))
@@ -326,7 +553,7 @@ def party() -> str:
 
         # Verify party exists
         try:
-            if not PartyLoader.get_party_by_id(selected_party_id):
+            if not PartyLoader.has_party(selected_party_id):
                 logger.warning(f"Party {selected_party_id} not found, using default")
                 selected_party_id = DEFAULT_PARTY_ID
         except Exception as e:
@@ -373,7 +600,7 @@ def encounter_custom() -> Any:
     if request.method == 'POST':
         try:
             data = validate_input(
-                request.get_json() or {},
+                read_json_body(),
                 max_length=MAX_INPUT_LENGTH_JSON
             )
             monsters = data.get('monsters', [])
@@ -409,7 +636,7 @@ def encounter_prebuilt() -> Any:
     """
     if request.method == 'POST':
         try:
-            data = validate_input(request.get_json() or {})
+            data = validate_input(read_json_body())
             template_name = data.get('template_name')
             party_level = int(data.get('party_level', 3))
             party_size = int(data.get('party_size', DEFAULT_PARTY_SIZE))
@@ -517,7 +744,7 @@ def api_encounter_debug() -> Tuple[Any, int]:
         return jsonify({'error': 'Debug endpoints only available in debug mode'}), 403
 
     try:
-        monsters = session.get('encounter_monsters', [])
+        monsters = load_monsters_from_session()
         selected_encounter = session.get('selected_encounter', None)
 
         debug_info = {
@@ -567,7 +794,7 @@ def api_monsters() -> Any:
         ValidationError: If CR format is invalid
     """
     cr = request.args.get('cr')
-    if cr and not re.match(r'^[0-9/]+$', cr):
+    if cr and not CR_PATTERN.match(cr):
         raise ValidationError("Invalid CR format")
 
     monsters = encounter_controller.builder.monster_data
@@ -589,7 +816,7 @@ def api_encounter_balance() -> Any:
     """
     try:
         data = validate_input(
-            request.get_json() or {},
+            read_json_body(),
             max_length=MAX_INPUT_LENGTH_JSON
         )
         monsters = data.get('monsters', [])
@@ -619,8 +846,7 @@ def api_prebuilt_encounters() -> Tuple[Any, int]:
         JSON response with template list
     """
     try:
-        with open(ENCOUNTER_TEMPLATES_FILE, 'r', encoding='utf-8') as f:
-            templates = json.load(f)["encounters"]
+        templates = load_prebuilt_templates()
         return jsonify(templates), 200
     except FileNotFoundError as e:
         log_exception(e)
@@ -647,18 +873,16 @@ def api_current_party() -> Any:
 
         if party:
             characters = party.get('characters', [])
-            # Override all character levels with selected_party_level for display
-            display_characters = []
+            # get_party_by_id returns a private copy, so stamp the selected
+            # level onto it in place rather than copying each character again
             for char in characters:
-                char_copy = char.copy()
-                char_copy['level'] = selected_party_level
-                display_characters.append(char_copy)
+                char['level'] = selected_party_level
 
             return jsonify({
                 'party_id': selected_party_id,
                 'party_level': selected_party_level,
                 'party_size': len(characters),
-                'characters': display_characters
+                'characters': characters
             })
         else:
             logger.warning(f"Party {selected_party_id} not found, returning defaults")
@@ -689,17 +913,18 @@ def simulate() -> Any:
     """
     session_id = session['session_id']
 
-    # Ensure session exists in database before starting simulation
-    try:
-        db.create_session(session_id, selected_party_id=session.get('selected_party_id'))
-    except Exception as e:
-        logger.error(f"Failed to create database session: {e}")
-        log_exception(e)
-
     # Check if we need to start a new simulation
     # (either no state exists, or the previous simulation is done)
     existing_state = simulation_controller.simulation_states.get(session_id)
     if not existing_state or existing_state.get('done', False):
+        # Ensure session exists in database before starting simulation
+        # (a page refresh on a running simulation skips this write)
+        try:
+            db.create_session(session_id, selected_party_id=session.get('selected_party_id'))
+        except Exception as e:
+            logger.error(f"Failed to create database session: {e}")
+            log_exception(e)
+
         # Clear old simulation ID from session when starting a new simulation
         if 'simulation_id' in session:
             del session['simulation_id']
@@ -732,10 +957,9 @@ def simulate_status() -> Any:
     Returns:
         JSON response with simulation status
     """
-    session_id = session.get('session_id', 'NO_SESSION_ID')
-    logger.info(f"Status endpoint called for session_id: {session_id}")
+    # Polled every second by the frontend; keep logging lazy and at debug level
     status = simulation_controller.handle_simulation_progress()
-    logger.info(f"Status endpoint returning: {status}")
+    logger.debug("Status endpoint returning for session_id %s: %s", session.get('session_id'), status)
     return jsonify(status)
 
 @app.route('/simulate/results', methods=['GET'])
@@ -746,21 +970,7 @@ def simulate_results() -> Response:
     Returns:
         Redirect response
     """
-    # Get the simulation ID from the session or simulation controller
-    sim_id = session.get('simulation_id')
-
-    if not sim_id:
-        # Try to get from simulation controller state
-        session_id = session['session_id']
-        sim_id = simulation_controller.get_simulation_id(session_id)
-
-        # If still no sim_id, try database
-        if not sim_id:
-            try:
-                sim_id = db.get_last_simulation_id(session_id)
-            except Exception as e:
-                logger.error(f"Failed to get simulation ID from database: {e}")
-                log_exception(e)
+    sim_id = resolve_simulation_id()
 
     if sim_id:
         return redirect(url_for('results', sim_id=sim_id))
@@ -779,7 +989,7 @@ def batch_simulation() -> str:
     Returns:
         Rendered HTML template
     """
-    return render_template('batch_simulation.html')
+    return render_template('batch_simulation.html', encounter_monsters=load_monsters_from_session())
 
 @app.route('/batch/start', methods=['POST'])
 def batch_simulation_start() -> Tuple[Any, int]:
@@ -793,9 +1003,15 @@ def batch_simulation_start() -> Tuple[Any, int]:
         ValidationError: If batch parameters are invalid
     """
     try:
-        data = validate_input(request.get_json() or {})
+        data = validate_input(read_json_body())
         num_runs = int(data.get('num_runs', 10))
         batch_name = data.get('batch_name', f'Batch {int(time.time())}')
+        seed = data.get('seed')
+        if seed is not None:
+            try:
+                seed = int(seed)
+            except (TypeError, ValueError):
+                raise ValidationError("seed must be an integer")
 
         if num_runs < MIN_BATCH_RUNS or num_runs > MAX_BATCH_RUNS:
             raise ValidationError(
@@ -812,10 +1028,13 @@ def batch_simulation_start() -> Tuple[Any, int]:
                 "Party and monsters must be selected before starting batch simulation"
             )
 
+        # Batch records belong to the session, so make sure its row exists
+        db.ensure_session(session_id)
+
         # Start batch simulation
         logger.info(f"Starting batch simulation: {num_runs} runs, {len(party)} party members, {len(monsters)} monsters")
         batch_id = batch_simulation_controller.execute_batch_simulation(
-            party, monsters, num_runs, batch_name, session_id
+            party, monsters, num_runs, batch_name, session_id, seed=seed
         )
 
         logger.info(f"Started batch simulation {batch_id} with {num_runs} runs")
@@ -841,7 +1060,8 @@ def batch_simulation_progress(batch_id: int) -> Tuple[Any, int]:
     """
     try:
         progress = batch_simulation_controller.get_batch_progress(batch_id)
-        logger.debug(f"Batch {batch_id} progress: {progress.get('completed_runs', 0)}/{progress.get('total_runs', 0)} runs, {progress.get('progress', 0):.1f}% complete")
+        logger.debug("Batch %s progress: %s/%s runs, %.1f%% complete", batch_id,
+                     progress.get('completed_runs', 0), progress.get('total_runs', 0), progress.get('progress', 0))
         return jsonify(progress), 200
     except Exception as e:
         log_exception(e)
@@ -911,50 +1131,28 @@ def results() -> str:
     Raises:
         ValidationError: If simulation ID is invalid
     """
-    # Prefer explicit sim_id from query string when provided; fall back to session
-    sim_id = request.args.get('sim_id', type=int) or session.get('simulation_id')
+    sim_id = resolve_simulation_id()
 
-    if sim_id and sim_id < 0:
-        raise ValidationError("Invalid simulation ID")
-
-    # If no sim_id provided, use the last simulation from the database for this session
     if not sim_id:
-        logger.info('/results: sim_id missing from query params and session')
-        session_id = session['session_id']
-
-        # First try to get from simulation controller state
-        sim_id = simulation_controller.get_simulation_id(session_id)
-
-        # If still no sim_id, try database
-        if not sim_id:
-            logger.info('/results: trying to get from database')
-            try:
-                sim_id = db.get_last_simulation_id(session_id)
-            except Exception as e:
-                logger.error(f"Failed to get simulation ID from database: {e}")
-                log_exception(e)
-
-        if not sim_id:
-            # No simulation found, return empty results
-            logger.warning("No simulation found for results display")
-            return render_template(
-                'results.html',
-                summary={'win_loss': 'No simulation found', 'party_status': 'No data'},
-                statistics=[],
-                log=[],
-                sim_id=None
-            )
+        # No simulation found, return empty results
+        logger.warning("No simulation found for results display")
+        return render_template(
+            'results.html',
+            summary={'win_loss': 'No simulation found', 'party_status': 'No data'},
+            statistics=[],
+            log=[],
+            sim_id=None
+        )
 
     # Build page data
     try:
-        summary = results_controller.format_simulation_results(sim_id)
-        statistics = results_controller.generate_combat_statistics(sim_id)
-        log = [sanitize_html(str(entry)) for entry in summary['logs']]
+        bundle = get_results_bundle(sim_id)
+        log = sanitize_html_batch(bundle['logs'])
 
         return render_template(
             'results.html',
-            summary=summary.get('simulation', {}),
-            statistics=statistics,
+            summary=bundle.get('simulation', {}),
+            statistics=bundle['statistics'],
             log=log,
             sim_id=sim_id
         )
@@ -971,22 +1169,34 @@ def results() -> str:
 
 @app.route('/results/detailed')
 @limiter.limit(RATE_LIMIT_RESULTS_DETAILED)
-def results_detailed() -> Dict[str, List[str]]:
+def results_detailed() -> Response:
     """
-    Get detailed combat log.
+    Stream the detailed combat log as newline-delimited JSON.
+
+    Each line is a JSON string holding one sanitized log entry, so the
+    log is never materialized in memory and clients can render as it arrives.
 
     Returns:
-        JSON-compatible dictionary with detailed log
+        Streaming application/x-ndjson response
 
     Raises:
         ValidationError: If simulation ID is invalid
     """
-    sim_id = session.get('simulation_id')
-    if sim_id and sim_id < 0:
-        raise ValidationError("Invalid simulation ID")
+    sim_id = resolve_simulation_id()
+
+    entries = results_controller.iter_detailed_log(sim_id)
+    # Fetch the first row eagerly so database errors reach the error handlers
+    # before the response headers are sent
+    first = next(entries, None)
 
-    log = results_controller.handle_detailed_log_display(sim_id)
-    return {'log': [sanitize_html(entry) for entry in log]}
+    def generate():
+        if first is None:
+            return
+        yield json.dumps(sanitize_html(str(first))) + '\n'
+        for entry in entries:
+            yield json.dumps(sanitize_html(str(entry))) + '\n'
+
+    return Response(stream_with_context(generate()), mimetype='application/x-ndjson')
 
 @app.route('/results/statistics')
 @limiter.limit(RATE_LIMIT_RESULTS_STATS)
@@ -1000,31 +1210,29 @@ def results_statistics() -> Dict[str, Any]:
     Raises:
         ValidationError: If simulation ID is invalid
     """
-    sim_id = session.get('simulation_id')
-    if sim_id and sim_id < 0:
-        raise ValidationError("Invalid simulation ID")
+    sim_id = resolve_simulation_id()
 
-    stats = results_controller.generate_combat_statistics(sim_id)
+    stats = get_combat_statistics(sim_id)
     return {'statistics': stats}
 
 @app.route('/results/export')
 @limiter.limit(RATE_LIMIT_RESULTS_EXPORT)
-def results_export() -> Tuple[str, int, Dict[str, str]]:
+def results_export() -> Response:
     """
     Export simulation results as JSON.
 
     Returns:
-        JSON string with results and content-type header
+        Compact JSON response with results
 
     Raises:
         ValidationError: If simulation ID is invalid
     """
-    sim_id = session.get('simulation_id')
-    if sim_id and sim_id < 0:
-        raise ValidationError("Invalid simulation ID")
+    sim_id = resolve_simulation_id()
 
-    summary = results_controller.format_simulation_results(sim_id)
-    return json.dumps(summary), 200, {'Content-Type': 'application/json'}
+    summary = get_simulation_results(sim_id)
+    # Compact separators drop the padding after every ',' and ':' in the logs
+    body = json.dumps(summary, separators=EXPORT_JSON_SEPARATORS).encode('utf-8')
+    return Response(body, mimetype='application/json')
 
 @app.route('/history')
 def history() -> str:
@@ -1056,6 +1264,22 @@ def healthz() -> Tuple[str, int]:
 
 # Error Handlers
 
+def wants_json_response() -> bool:
+    """
+    Check whether the client expects a JSON error body (fetch/AJAX callers).
+
+    Only evaluated on the error path, so successful requests never pay for it.
+    request.is_json already covers the application/json content type, and
+    the Accept header is parsed once and cached by Werkzeug.
+
+    Returns:
+        True if the error should be rendered as JSON
+    """
+    if request.is_json:
+        return True
+    accept = request.accept_mimetypes
+    return accept.accept_json and not accept.accept_html
+
 @app.errorhandler(AppError)
 def handle_app_error(error: AppError) -> Tuple[Any, int]:
     """
@@ -1069,15 +1293,7 @@ def handle_app_error(error: AppError) -> Tuple[Any, int]:
     """
     log_exception(error)
 
-    # Check if this is a JSON request (from fetch/AJAX)
-    is_json_request = (
-        request.is_json or
-        request.content_type == 'application/json' or
-        request.headers.get('Content-Type') == 'application/json' or
-        (request.accept_mimetypes.accept_json and not request.accept_mimetypes.accept_html)
-    )
-
-    if is_json_request:
+    if wants_json_response():
         response = jsonify({
             'error': str(error),
             'type': error.__class__.__name__
@@ -1099,15 +1315,7 @@ def handle_unexpected_error(error: Exception) -> Tuple[Any, int]:
     """
     log_exception(error)
 
-    # Check if this is a JSON request (from fetch/AJAX)
-    is_json_request = (
-        request.is_json or
-        request.content_type == 'application/json' or
-        request.headers.get('Content-Type') == 'application/json' or
-        (request.accept_mimetypes.accept_json and not request.accept_mimetypes.accept_html)
-    )
-
-    if is_json_request:
+    if wants_json_response():
         response = jsonify({
             'error': 'An unexpected error occurred.',
             'type': error.__class__.__name__
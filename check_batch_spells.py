@@ -1,6 +1,8 @@
 """Check spell actions in batch simulations."""
 
 import sqlite3
+from itertools import groupby
+from operator import itemgetter
 
 # Direct database access
 conn = sqlite3.connect('dnd5e_sim.db')
@@ -10,63 +12,78 @@ print("=" * 70)
 print("CHECKING BATCH SIMULATIONS FOR SPELL ACTIONS")
 print("=" * 70)
 
-# Get recent batch simulations
-cursor = conn.execute('''
-    SELECT id, batch_name, created_at
-    FROM batch_simulations
-    ORDER BY id DESC
-    LIMIT 5
+# The five most recent batches and the first run recorded for each
+RECENT_FIRST_RUNS = '''
+    WITH recent AS (
+        SELECT id, batch_name, created_at
+        FROM batch_simulations
+        ORDER BY id DESC
+        LIMIT 5
+    ),
+    run_counts AS (
+        SELECT batch_id, COUNT(*) AS total_sims, MIN(id) AS first_run_id
+        FROM batch_simulation_runs
+        WHERE batch_id IN (SELECT id FROM recent)
+        GROUP BY batch_id
+    )
+'''
+
+# Action breakdown for every batch's first simulation in one round-trip
+cursor = conn.execute(RECENT_FIRST_RUNS + '''
+    SELECT recent.id, recent.batch_name, recent.created_at,
+           COALESCE(rc.total_sims, 0) AS total_sims,
+           bsr.simulation_id AS first_sim,
+           cl.action_type, COUNT(cl.id) AS count
+    FROM recent
+    LEFT JOIN run_counts rc ON rc.batch_id = recent.id
+    LEFT JOIN batch_simulation_runs bsr ON bsr.id = rc.first_run_id
+    LEFT JOIN combat_logs cl ON cl.simulation_id = bsr.simulation_id
+    GROUP BY recent.id, cl.action_type
+    ORDER BY recent.id DESC, cl.action_type
+''')
+batches = [(batch_id, list(rows)) for batch_id, rows in
+           groupby(cursor.fetchall(), key=itemgetter('id'))]
+
+# Up to three example spell actions per first simulation
+cursor = conn.execute(RECENT_FIRST_RUNS + '''
+    SELECT batch_id, round_number, character_name, result
+    FROM (
+        SELECT bsr.batch_id, cl.round_number, cl.character_name, cl.result,
+               ROW_NUMBER() OVER (PARTITION BY bsr.batch_id ORDER BY cl.id) AS rn
+        FROM run_counts rc
+        JOIN batch_simulation_runs bsr ON bsr.id = rc.first_run_id
+        JOIN combat_logs cl ON cl.simulation_id = bsr.simulation_id
+        WHERE cl.action_type = 'spell'
+    )
+    WHERE rn <= 3
+    ORDER BY batch_id, rn
 ''')
-batches = cursor.fetchall()
+spell_examples_by_batch = {batch_id: list(rows) for batch_id, rows in
+                           groupby(cursor.fetchall(), key=itemgetter('batch_id'))}
 
 print(f"\nFound {len(batches)} recent batch simulations:\n")
 
-for batch in batches:
-    batch_id = batch['id']
-    batch_name = batch['batch_name']
-    created_at = batch['created_at']
+for batch_id, rows in batches:
+    batch = rows[0]
 
-    print(f"Batch ID {batch_id}: {batch_name}")
-    print(f"  Created: {created_at}")
-
-    # Get simulations in this batch
-    cursor = conn.execute('''
-        SELECT simulation_id
-        FROM batch_simulation_runs
-        WHERE batch_id = ?
-    ''', (batch_id,))
-    sim_ids = [row['simulation_id'] for row in cursor.fetchall()]
+    print(f"Batch ID {batch_id}: {batch['batch_name']}")
+    print(f"  Created: {batch['created_at']}")
+    print(f"  Total simulations: {batch['total_sims']}")
 
-    print(f"  Total simulations: {len(sim_ids)}")
-
-    if not sim_ids:
+    if not batch['total_sims']:
         print("  (No simulations found)\n")
         continue
 
     # Check first simulation in detail
-    first_sim = sim_ids[0]
-
-    # Count all action types
-    cursor = conn.execute('''
-        SELECT action_type, COUNT(*) as count
-        FROM combat_logs
-        WHERE simulation_id = ?
-        GROUP BY action_type
-    ''', (first_sim,))
-    action_counts = cursor.fetchall()
+    first_sim = batch['first_sim']
 
     print(f"\n  First simulation (ID {first_sim}) action breakdown:")
-    for row in action_counts:
-        print(f"    {row['action_type']}: {row['count']}")
-
-    # Get example spell actions if any
-    cursor = conn.execute('''
-        SELECT round_number, character_name, result
-        FROM combat_logs
-        WHERE simulation_id = ? AND action_type = 'spell'
-        LIMIT 3
-    ''', (first_sim,))
-    spell_examples = cursor.fetchall()
+    for row in rows:
+        if row['count']:
+            print(f"    {row['action_type']}: {row['count']}")
+
+    # Show example spell actions if any
+    spell_examples = spell_examples_by_batch.get(batch_id, [])
 
     if spell_examples:
         print(f"\n  Example spell actions:")
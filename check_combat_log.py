@@ -1,23 +1,17 @@
 """Check what's actually in the combat log before database save."""
 
-import json
+from collections import Counter
 from models.character import Character
 from models.monster import Monster
 from models.spell_manager import SpellManager
 from models.combat import Combat
+from utils.party_loader import PartyLoader
 
 # Create spell manager
 spell_manager = SpellManager()
 
-# Load level 5 character data
-with open('data/characters.json', 'r') as f:
-    char_data = json.load(f)
-
-level_5_party = None
-for level_obj in char_data:
-    if level_obj.get('level') == 5:
-        level_5_party = level_obj.get('party', [])
-        break
+# Load level 5 character data (parsed once and indexed by level)
+level_5_party = PartyLoader.get_characters_for_level(5)
 
 # Create characters
 characters = []
@@ -73,19 +67,22 @@ print("=" * 70)
 log = result.get('log', [])
 print(f"\nTotal log entries: {len(log)}")
 
-# Count action types in the RAW log
-action_entries = [e for e in log if e.get('type') == 'action']
-print(f"Action entries: {len(action_entries)}")
-
-action_type_counts = {}
+# Count action types in the RAW log in a single pass
+action_count = 0
+first_actions = []
+action_type_counts = Counter()
 spell_actions = []
-for entry in action_entries:
-    result_dict = entry.get('result', {})
-    action_type = result_dict.get('type', 'unknown')
-    action_type_counts[action_type] = action_type_counts.get(action_type, 0) + 1
-
+for entry in log:
+    if entry.get('type') != 'action':
+        continue
+    action_count += 1
+    if len(first_actions) < 10:
+        first_actions.append(entry)
+    action_type = entry.get('result', {}).get('type', 'unknown')
+    action_type_counts[action_type] += 1
     if action_type == 'spell':
         spell_actions.append(entry)
+print(f"Action entries: {action_count}")
 
 print(f"\nAction type breakdown in RAW log:")
 for atype, count in sorted(action_type_counts.items()):
@@ -105,7 +102,7 @@ if spell_actions:
 else:
     print(f"\n✗ FAILURE: NO SPELL ACTIONS in raw log")
     print("\nFirst 10 action entries:")
-    for i, entry in enumerate(action_entries[:10]):
+    for i, entry in enumerate(first_actions):
         result_dict = entry.get('result', {})
         print(f"  {i+1}. Round {entry.get('round')}: {result_dict}")
 
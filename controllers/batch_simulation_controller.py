@@ -1,8 +1,16 @@
+import functools
+import json
+import multiprocessing
+import os
+import pickle
+import random
 import threading
 import time
-import json
 import re
-from typing import List, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import List, Dict, Any, Mapping, Optional
 from models.combat import Combat
 from models.db import DatabaseManager
 from models.character import Character
@@ -11,21 +19,184 @@ from models.spell_manager import SpellManager
 from models.actions import AttackAction, Action
 from utils.exceptions import SimulationError, BatchSimulationError
 from utils.logging import log_exception
+from utils.party_loader import read_json_file
+
+def _usable_cpus() -> int:
+    """CPUs this process may run on; in a container this can be fewer than os.cpu_count()."""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:  # not available on macOS or Windows
+        return os.cpu_count() or 1
+
+# Batches beyond this many run queued instead of each getting its own thread
+MAX_CONCURRENT_BATCHES = int(os.environ.get('BATCH_WORKERS', min(4, _usable_cpus())))
+
+# Worker processes in the shared run pool; fewer than two disables the pool
+RUN_PROCESSES = int(os.environ.get('BATCH_PROCESSES', _usable_cpus()))
+
+CHARACTERS_FILE = 'data/characters.json'
+
+# Shared fallback for dicts without ability scores; Character and Monster copy it
+DEFAULT_ABILITY_SCORES = {'str': 10, 'dex': 10, 'con': 10, 'int': 10, 'wis': 10, 'cha': 10}
+
+# Finished runs are written to the database in transactions of this many
+BATCH_WRITE_SIZE = 100
+
+# Batches with at least this many runs spread their runs across processes
+PARALLEL_RUN_THRESHOLD = 50
+
+# Progress reported for batches this controller has no state for; shared, like
+# published snapshots, so callers must not modify it
+_UNKNOWN_BATCH_PROGRESS = {
+    'progress': 0,
+    'completed_runs': 0,
+    'failed_runs': 0,
+    'total_runs': 0,
+    'party_wins': 0,
+    'monster_wins': 0,
+    'done': False,
+    'error': None
+}
+
+# Progress snapshots are published at most this often, in seconds (and at the end)
+PROGRESS_PUBLISH_INTERVAL = 0.1
+
+# How long a batch waits on the run pool before re-checking for shutdown, in seconds
+RESULT_POLL_INTERVAL = 0.5
+
+# Per-process controller used by pool workers to build combatants
+_run_worker = None
+
+# Per-process combatants for recently seen encounters, reset and reused for
+# every run; keyed by the pickled (party, monsters) spec so repeated batches of
+# the same encounter skip rebuilding them: spec -> combatants
+_run_combatants = {}
+
+@functools.lru_cache(maxsize=2)
+def _read_character_index(path: str, mtime_ns: int) -> Mapping[tuple, Dict[str, Any]]:
+    """
+    Parse characters.json once per process into {(name, class, level): character_data}.
+
+    Shared by every controller instance and pool worker in the process, so
+    it is returned as a read-only view; a failed read raises and is not cached.
+    Callers pass the file's mtime so an edited file is parsed again.
+    """
+    characters_data = read_json_file(path)
+
+    index = {}
+    for level_data in characters_data:
+        level = level_data.get('level')
+        for char in level_data.get('party', []):
+            index[(char.get('name'), char.get('character_class'), level)] = char
+    return MappingProxyType(index)
+
+def _same_combatant(combatant):
+    """Builder for entries that are already Character or Monster objects."""
+    return combatant
+
+def _with_builders(entries, builders: Dict[type, Any]):
+    """
+    Pair each entry with its builder, looked up by exact type first.
+
+    Subclasses (e.g. an OrderedDict) fall back to an isinstance scan; entries
+    no builder accepts are dropped.
+    """
+    for entry in entries or []:
+        build = builders.get(type(entry))
+        if build is None:
+            build = next((b for cls, b in builders.items() if isinstance(entry, cls)), None)
+            if build is None:
+                continue
+        yield entry, build
+
+@dataclass(slots=True)
+class _BatchCounters:
+    """Running totals for one batch, updated only by the batch's worker thread."""
+    progress: float = 0
+    completed_runs: int = 0
+    failed_runs: int = 0
+    party_wins: int = 0
+    monster_wins: int = 0
+    queued: bool = True
+    done: bool = False
+
+    def snapshot(self, **extra) -> Dict[str, Any]:
+        """Return the counters as a new progress dict, merged with any extra fields."""
+        state = {name: getattr(self, name) for name in self.__slots__}
+        state.update(extra)
+        return state
+
+def _init_run_worker():
+    """Pool initializer: build the spell and character lookups once per process."""
+    global _run_worker
+    _run_worker = BatchSimulationController._for_run_worker()
+
+def _run_one(task):
+    """Run a single combat in a pool worker; returns (run_number, result, error)."""
+    run_number, base_seed, spec = task
+    try:
+        # Combatants are built once per worker for each encounter, then reset per
+        # run; a worker runs one task at a time, so batches can share them
+        combatants = _run_combatants.get(spec)
+        if combatants is None:
+            party, monsters = pickle.loads(spec)
+            templates = _run_worker._build_combatants(party, monsters)
+            combatants = _run_combatants[spec] = [c.clone() for c in templates]
+            while len(_run_combatants) > MAX_CONCURRENT_BATCHES:
+                del _run_combatants[next(iter(_run_combatants))]
+        for combatant in combatants:
+            combatant.reset_combat_state()
+        # Each run gets its own dice stream, derived from the batch seed
+        combat = Combat(combatants, rng=random.Random(base_seed + run_number))
+        result = combat.run()
+        # Ship compact database rows instead of the nested log: a smaller pickle
+        # back to the parent, and the conversion runs here in parallel
+        result['log_rows'] = DatabaseManager.combat_log_rows(result.pop('log', []))
+        return run_number, result, None
+    except Exception as e:
+        return run_number, None, SimulationError(str(e))
+
+def _run_chunk(tasks):
+    """Run a chunk of tasks in a pool worker; returns their _run_one results."""
+    return [_run_one(task) for task in tasks]
 
 class BatchSimulationController:
-    def __init__(self):
-        self.db = DatabaseManager()
-        self.spell_manager = SpellManager()
-        self.batch_threads = {}  # batch_id -> thread
+    def __init__(self, db: Optional[DatabaseManager] = None, spell_manager: Optional[SpellManager] = None):
+        # Share the app's managers when given so one DatabaseManager (and its
+        # request-scoped connection) serves every controller
+        self.db = db or DatabaseManager()
+        self.spell_manager = spell_manager or SpellManager()
+        self.executor = ThreadPoolExecutor(
+            max_workers=MAX_CONCURRENT_BATCHES, thread_name_prefix='batch'
+        )
+        self.batch_futures = {}  # batch_id -> Future
+        self.run_pool = None  # Process pool for per-run fan-out, started lazily
         self.batch_states = {}   # batch_id -> state dict
-        self.state_lock = threading.Lock()  # Thread safety for shared state
+        self.state_lock = threading.Lock()  # Guards adding, removing and iterating batches, and pool start-up
+        self.stopping = threading.Event()  # Set by shutdown() to end running batches between runs
         self.character_cache = None  # Cache for character data
         self._load_character_cache()
 
-    def execute_batch_simulation(self, party, monsters, num_runs: int, batch_name: str, session_id: str):
+    @classmethod
+    def _for_run_worker(cls):
+        """
+        Build a controller for a pool worker process: combatant lookups only,
+        with no database handle or batch executor.
+        """
+        controller = cls.__new__(cls)
+        controller.spell_manager = SpellManager()
+        controller._load_character_cache()
+        return controller
+
+    def execute_batch_simulation(self, party, monsters, num_runs: int, batch_name: str, session_id: str,
+                                 seed: Optional[int] = None):
         """
-        Start a batch combat simulation in a background thread.
+        Queue a batch combat simulation on the background worker pool.
         Returns the batch_id for tracking.
+
+        Run N is seeded with seed + N, so passing the seed a batch reports
+        in its progress replays the same combats. A random seed is used when
+        none is given.
         """
         from utils.logging import logger
 
@@ -45,218 +216,325 @@ class BatchSimulationController:
         logger.info("Input validation passed")
 
         # Create batch simulation record first
-        party_level = max([char.get('level', 1) for char in party]) if party else 1
+        party_level = max((char.get('level', 1) for char in party), default=1)
         encounter_type = 'custom'  # Could be enhanced to detect prebuilt encounters
         logger.info(f"Creating batch simulation record: party_level={party_level}, encounter_type={encounter_type}")
         batch_id = self.db.create_batch_simulation(session_id, batch_name, party_level, encounter_type)
         logger.info(f"Created batch simulation with ID: {batch_id}")
 
+        base_seed = seed if seed is not None else random.getrandbits(32)
+
+        # Only this batch's worker touches its counters; readers see published snapshots
+        counters = _BatchCounters()
+
+        def publish():
+            """Replace the batch's published state with a snapshot of the counters."""
+            # Rebinding an existing key is atomic, so readers never see a half-applied update
+            self.batch_states[batch_id] = counters.snapshot(seed=base_seed, total_runs=num_runs, error=None)
+
         # Initialize state BEFORE starting thread so it's immediately available for progress polling
         with self.state_lock:
-            self.batch_states[batch_id] = {
-                'progress': 0,
-                'completed_runs': 0,
-                'failed_runs': 0,
-                'total_runs': num_runs,
-                'party_wins': 0,
-                'monster_wins': 0,
-                'total_rounds': 0,
-                'total_party_hp_remaining': 0,
-                'done': False,
-                'error': None
-            }
+            publish()
 
         logger.info(f"Initialized batch state for batch_id={batch_id}")
 
         def run():
+            # Reuse one connection for every bulk write of this batch instead of
+            # opening (and re-running the connection PRAGMAs) for each flush
+            self.db.begin_request_scope()
             try:
-                logger.info(f"Batch {batch_id} thread started, beginning {num_runs} simulations")
-
-                # Run simulations
-                for run_number in range(1, num_runs + 1):
-                    logger.debug(f"Batch {batch_id}: Starting run {run_number}/{num_runs}")
+                logger.info(f"Batch {batch_id} worker started, beginning {num_runs} simulations")
+                counters.queued = False
+                publish()
+
+                pending = []  # (run_number, result) awaiting one bulk write
+                processed = 0
+                next_publish = time.monotonic() + PROGRESS_PUBLISH_INTERVAL
+
+                def flush():
+                    """Persist pending runs in one transaction, then count them."""
+                    if not pending:
+                        return
                     try:
-                        # Convert party dictionaries to Character objects
-                        character_objects = []
-                        if party:
-                            for char_data in party:
-                                if isinstance(char_data, dict):
-                                    # Load full character data from characters.json
-                                    full_char_data = self._load_full_character_data(char_data)
-                                    if full_char_data:
-                                        char = Character(
-                                            name=full_char_data.get('name', char_data.get('name', 'Unknown')),
-                                            level=full_char_data.get('level', char_data.get('level', 1)),
-                                            character_class=full_char_data.get('character_class', char_data.get('class', 'Fighter')),
-                                            race=full_char_data.get('race', 'Human'),
-                                            ability_scores=full_char_data.get('ability_scores', {'str': 10, 'dex': 10, 'con': 10, 'int': 10, 'wis': 10, 'cha': 10}),
-                                            hp=full_char_data.get('hp', 10),
-                                            ac=full_char_data.get('ac', 10),
-                                            proficiency_bonus=full_char_data.get('proficiency_bonus', 2),
-                                            spell_slots=full_char_data.get('spell_slots', {}),
-                                            spell_list=full_char_data.get('spell_list', [])
-                                        )
-                                        # Add spells to character
-                                        for spell_name in full_char_data.get('spell_list', []):
-                                            spell = self.spell_manager.get_spell(spell_name)
-                                            if spell:
-                                                char.add_spell(spell)
-                                        character_objects.append(char)
-                                    else:
-                                        # Fallback to basic character creation
-                                        char = Character(
-                                            name=char_data.get('name', 'Unknown'),
-                                            level=char_data.get('level', 1),
-                                            character_class=char_data.get('class', 'Fighter'),
-                                            race=char_data.get('race', 'Human'),
-                                            ability_scores=char_data.get('ability_scores', {'str': 10, 'dex': 10, 'con': 10, 'int': 10, 'wis': 10, 'cha': 10}),
-                                            hp=char_data.get('hp', 10),
-                                            ac=char_data.get('ac', 10),
-                                            proficiency_bonus=char_data.get('proficiency_bonus', 2)
-                                        )
-                                        character_objects.append(char)
-                                elif isinstance(char_data, Character):
-                                    character_objects.append(char_data)
-                        
-                        # Convert monster dictionaries to Monster objects
-                        monster_objects = []
-                        if monsters:
-                            for monster_data in monsters:
-                                if isinstance(monster_data, dict):
-                                    # Build actions from JSON data (same as single simulation controller)
-                                    actions = self._build_actions_from_dicts(monster_data.get('actions', []))
-
-                                    monster = Monster(
-                                        name=monster_data.get('name', 'Unknown'),
-                                        challenge_rating=monster_data.get('cr', '1/4'),
-                                        hp=monster_data.get('hp', 10),
-                                        ac=monster_data.get('ac', 10),
-                                        ability_scores=monster_data.get('ability_scores', {'str': 10, 'dex': 10, 'con': 10, 'int': 10, 'wis': 10, 'cha': 10}),
-                                        damage_resistances=monster_data.get('damage_resistances', []),
-                                        damage_immunities=monster_data.get('damage_immunities', []),
-                                        special_abilities=monster_data.get('special_abilities', []),
-                                        legendary_actions=monster_data.get('legendary_actions', []),
-                                        multiattack=monster_data.get('multiattack', False),
-                                        actions=actions
-                                    )
-                                    monster_objects.append(monster)
-                                elif isinstance(monster_data, Monster):
-                                    monster_objects.append(monster_data)
-                        
-                        # Create combat and run simulation
-                        logger.debug(f"Batch {batch_id} run {run_number}: Creating combat with {len(character_objects)} characters and {len(monster_objects)} monsters")
-                        combat = Combat(character_objects + monster_objects)
-                        logger.debug(f"Batch {batch_id} run {run_number}: Running combat simulation")
-                        result = combat.run()
-                        logger.debug(f"Batch {batch_id} run {run_number}: Combat finished, winner={result.get('winner', 'unknown')}, rounds={result.get('rounds', 0)}")
-
-                        # Save individual simulation
-                        sim_id = self.db.save_simulation_result(session_id, result)
-                        logger.debug(f"Batch {batch_id} run {run_number}: Saved simulation as ID {sim_id}")
-
-                        # Add to batch
-                        self.db.add_batch_run(
-                            batch_id, sim_id, run_number,
-                            result.get('winner', 'unknown'),
-                            result.get('rounds', 0),
-                            result.get('party_hp_remaining', 0)
-                        )
-                        logger.debug(f"Batch {batch_id} run {run_number}: Added to batch")
-
-                        # Update batch statistics with thread safety
-                        with self.state_lock:
-                            state = self.batch_states[batch_id]
-                            state['completed_runs'] += 1
-                            state['total_rounds'] += result.get('rounds', 0)
-                            state['total_party_hp_remaining'] += result.get('party_hp_remaining', 0)
-
-                            if result.get('winner') == 'party':
-                                state['party_wins'] += 1
-                            else:
-                                state['monster_wins'] += 1
-
-                            # Update progress (includes both completed and failed)
-                            total_processed = state['completed_runs'] + state['failed_runs']
-                            state['progress'] = (total_processed / state['total_runs']) * 100
-
+                        self.db.save_batch_runs(session_id, batch_id, pending)
+                        logger.debug(f"Batch {batch_id}: Saved {len(pending)} runs")
                     except Exception as e:
-                        logger.error(f"Batch {batch_id} run {run_number} failed with error: {e}", exc_info=True)
+                        logger.error(f"Batch {batch_id}: saving {len(pending)} runs failed with error: {e}", exc_info=True)
                         log_exception(e)
-                        # Track failed runs
-                        with self.state_lock:
-                            state = self.batch_states[batch_id]
-                            state['failed_runs'] += 1
-                            total_processed = state['completed_runs'] + state['failed_runs']
-                            state['progress'] = (total_processed / state['total_runs']) * 100
-                        # Continue with next run even if one fails
-                        continue
+                        counters.failed_runs += len(pending)
+                        pending.clear()
+                        return
+
+                    # Tally locally, then touch each counter once per flush
+                    saved = len(pending)
+                    party_wins = sum(1 for _, result in pending if result.get('winner') == 'party')
+                    counters.completed_runs += saved
+                    counters.party_wins += party_wins
+                    counters.monster_wins += saved - party_wins
+                    pending.clear()
+
+                # Run simulations (in worker processes when the batch is large enough)
+                for run_number, result, error in self._iter_run_results(party, monsters, num_runs, base_seed):
+                    processed += 1
+                    if error is not None:
+                        logger.error(f"Batch {batch_id} run {run_number} failed with error: {error}", exc_info=error)
+                        log_exception(error)
+                        # Track failed runs and continue with the next run
+                        counters.failed_runs += 1
+                    else:
+                        logger.debug(f"Batch {batch_id} run {run_number}: Combat finished, winner={result.get('winner', 'unknown')}, rounds={result.get('rounds', 0)}")
+                        pending.append((run_number, result))
+                        if len(pending) >= BATCH_WRITE_SIZE:
+                            flush()
+
+                    # Progress counts finished runs, including ones still waiting to be written.
+                    # Publishing by time coalesces bursts of pool results into one snapshot
+                    # while slow runs still show up as soon as they finish
+                    now = time.monotonic()
+                    if now >= next_publish:
+                        counters.progress = (processed / num_runs) * 100
+                        publish()
+                        next_publish = now + PROGRESS_PUBLISH_INTERVAL
+
+                flush()
+                counters.progress = (processed / num_runs) * 100
+                publish()
+
+                if processed < num_runs and self.stopping.is_set():
+                    logger.warning(f"Batch {batch_id} stopped by shutdown after {processed} of {num_runs} runs")
+                    self.batch_states[batch_id] = counters.snapshot(
+                        seed=base_seed, total_runs=num_runs, done=True,
+                        error='Server shut down before the batch finished'
+                    )
+                    return
 
                 logger.info(f"Batch {batch_id} completed all {num_runs} runs, finalizing statistics")
 
-                # Finalize batch statistics with thread safety
-                with self.state_lock:
-                    state = self.batch_states[batch_id]
-                    if state['completed_runs'] > 0:
-                        avg_rounds = state['total_rounds'] / state['completed_runs']
-                        avg_party_hp = state['total_party_hp_remaining'] / state['completed_runs']
-                    else:
-                        avg_rounds = 0
-                        avg_party_hp = 0
-
-                    logger.info(f"Batch {batch_id}: Updating database statistics")
-                    self.db.update_batch_statistics(
-                        batch_id, state['completed_runs'], state['party_wins'],
-                        state['monster_wins'], avg_rounds, avg_party_hp
-                    )
+                # Averages come from the saved runs, so the worker only counts wins
+                logger.info(f"Batch {batch_id}: Updating database statistics")
+                self.db.update_batch_statistics_from_runs(batch_id)
 
-                    state['done'] = True
-                    logger.info(f"Batch {batch_id} COMPLETE: {state['completed_runs']} runs, {state['party_wins']} party wins, {state['monster_wins']} monster wins")
+                counters.done = True
+                publish()
+                logger.info(f"Batch {batch_id} COMPLETE: {counters.completed_runs} runs, {counters.party_wins} party wins, {counters.monster_wins} monster wins")
 
             except Exception as e:
                 logger.error(f"Batch {batch_id} thread failed with fatal error: {e}", exc_info=True)
                 log_exception(e)
                 # Don't raise in thread - store error in state instead
-                with self.state_lock:
-                    self.batch_states[batch_id] = {
-                        'error': str(e),
-                        'done': True,
-                        'progress': 0,
-                        'completed_runs': 0,
-                        'failed_runs': 0,
-                        'total_runs': num_runs
-                    }
-
-        logger.info(f"Batch {batch_id}: Starting background thread")
-        t = threading.Thread(target=run)
-        t.daemon = False  # Ensure thread is not daemon so it completes
-        t.start()
-        self.batch_threads[batch_id] = t
-        logger.info(f"Batch {batch_id}: Thread started, is_alive={t.is_alive()}")
+                self.batch_states[batch_id] = {
+                    'seed': base_seed,
+                    'error': str(e),
+                    'queued': False,
+                    'done': True,
+                    'progress': 0,
+                    'completed_runs': 0,
+                    'failed_runs': 0,
+                    'total_runs': num_runs
+                }
+            finally:
+                self.db.end_request_scope()
+
+        logger.info(f"Batch {batch_id}: Queueing on batch worker pool")
+        self.batch_futures[batch_id] = self.executor.submit(run)
         return batch_id
 
+    def _iter_run_results(self, party, monsters, num_runs: int, base_seed: int):
+        """
+        Yield (run_number, result, error) for each run of a batch.
+
+        Runs are independent, so large batches fan out across a process pool.
+        Small batches also use the pool once it is running, keeping combat off
+        the web process's GIL; before that (or on single-core hosts) they run
+        inline on the batch worker. Either way run N draws its dice from its
+        own random.Random(base_seed + N), never the process-wide generator.
+        """
+        processes = RUN_PROCESSES
+        if processes < 2 or (num_runs < PARALLEL_RUN_THRESHOLD and self.run_pool is None):
+            # Build the combatants once; every run resets and reuses the same clones
+            try:
+                combatants = [c.clone() for c in self._build_combatants(party, monsters)]
+            except Exception as e:
+                for run_number in range(1, num_runs + 1):
+                    yield run_number, None, e
+                return
+            for run_number in range(1, num_runs + 1):
+                if self.stopping.is_set():
+                    return
+                try:
+                    for combatant in combatants:
+                        combatant.reset_combat_state()
+                    combat = Combat(combatants, rng=random.Random(base_seed + run_number))
+                    yield run_number, combat.run(), None
+                except Exception as e:
+                    yield run_number, None, e
+            return
+
+        from utils.logging import logger
+
+        pool = self._get_run_pool()
+        logger.info(f"Running {num_runs} runs on {processes} processes, base seed {base_seed}")
+        # Serialize the combatant data once; each task carries the same bytes and
+        # workers only unpickle them when building templates for a new encounter
+        spec = pickle.dumps((party, monsters), protocol=pickle.HIGHEST_PROTOCOL)
+        tasks = [(run_number, base_seed, spec)
+                 for run_number in range(1, num_runs + 1)]
+        # About eight chunks per process: few enough to amortize the IPC round
+        # trips, enough that a slow chunk doesn't leave the other cores idle
+        chunksize = max(1, num_runs // (processes * 8))
+        # Chunk here rather than via imap's chunksize, which hides the result
+        # iterator (and its next(timeout)) behind a plain generator
+        chunks = [tasks[i:i + chunksize] for i in range(0, num_runs, chunksize)]
+        results = pool.imap_unordered(_run_chunk, chunks)
+        # Wait in short slices so shutdown() can stop the batch before it
+        # terminates the pool; a terminated pool never delivers the rest
+        for _ in range(len(chunks)):
+            while True:
+                if self.stopping.is_set():
+                    return
+                try:
+                    chunk_results = results.next(RESULT_POLL_INTERVAL)
+                except multiprocessing.TimeoutError:
+                    continue
+                break
+            yield from chunk_results
+
+    def warm_up(self):
+        """
+        Start the run pool in the background so the first large batch does not
+        wait for worker processes to spawn and load their spell and character data.
+        Single-core hosts never use the pool, so this does nothing there.
+        """
+        if RUN_PROCESSES < 2:
+            return
+        threading.Thread(target=self._get_run_pool, name='batch-pool-warmup', daemon=True).start()
+
+    def _get_run_pool(self):
+        """
+        Return the shared run pool, starting it on first use.
+
+        The pool outlives individual batches so worker start-up (interpreter
+        spawn, spell and character loading) is paid once per server process.
+        """
+        with self.state_lock:
+            if self.run_pool is None:
+                # spawn avoids forking a multi-threaded server process
+                ctx = multiprocessing.get_context('spawn')
+                self.run_pool = ctx.Pool(processes=RUN_PROCESSES, initializer=_init_run_worker)
+            return self.run_pool
+
+    def _build_combatants(self, party, monsters) -> List[Any]:
+        """
+        Build Character and Monster objects from party and monster data.
+
+        Batch runs treat these as templates and fight on clone()s of them.
+        Entries are dicts to convert or ready-made model objects to use as
+        they are; anything else is skipped.
+        """
+        # Identical monsters (a mob of goblins) share one list of built actions
+        built_actions = {}
+        character_builders = {dict: self._character_from_dict, Character: _same_combatant}
+        monster_builders = {
+            dict: functools.partial(self._monster_from_dict, built_actions=built_actions),
+            Monster: _same_combatant,
+        }
+        character_objects = [
+            build(char_data) for char_data, build in _with_builders(party, character_builders)
+        ]
+        monster_objects = [
+            build(monster_data) for monster_data, build in _with_builders(monsters, monster_builders)
+        ]
+        return character_objects + monster_objects
+
+    def _character_from_dict(self, char_data: Dict[str, Any]) -> Character:
+        """Convert a party member dict to a Character, preferring full data from characters.json."""
+        full_char_data = self._load_full_character_data(char_data)
+        if full_char_data:
+            char = Character(
+                name=full_char_data.get('name', char_data.get('name', 'Unknown')),
+                level=full_char_data.get('level', char_data.get('level', 1)),
+                character_class=full_char_data.get('character_class', char_data.get('class', 'Fighter')),
+                race=full_char_data.get('race', 'Human'),
+                ability_scores=full_char_data.get('ability_scores', DEFAULT_ABILITY_SCORES),
+                hp=full_char_data.get('hp', 10),
+                ac=full_char_data.get('ac', 10),
+                proficiency_bonus=full_char_data.get('proficiency_bonus', 2),
+                spell_slots=full_char_data.get('spell_slots', {}),
+                spell_list=full_char_data.get('spell_list', [])
+            )
+            # Attach the pre-resolved spells in one update; they were looked up by
+            # the names in spell_list, so add_spell's list bookkeeping is not needed
+            char.spells.update(self._resolve_spells(full_char_data.get('spell_list', [])))
+            return char
+
+        # Fallback to basic character creation
+        return Character(
+            name=char_data.get('name', 'Unknown'),
+            level=char_data.get('level', 1),
+            character_class=char_data.get('class', 'Fighter'),
+            race=char_data.get('race', 'Human'),
+            ability_scores=char_data.get('ability_scores', DEFAULT_ABILITY_SCORES),
+            hp=char_data.get('hp', 10),
+            ac=char_data.get('ac', 10),
+            proficiency_bonus=char_data.get('proficiency_bonus', 2)
+        )
+
+    def _monster_from_dict(self, monster_data: Dict[str, Any],
+                           built_actions: Optional[Dict[str, List[Action]]] = None) -> Monster:
+        """
+        Convert a monster dict to a Monster.
+
+        built_actions, when given, memoizes actions by their JSON so monsters
+        with identical action lists share one set of (stateless) Action objects.
+        """
+        # Build actions from JSON data (same as single simulation controller)
+        action_dicts = monster_data.get('actions', [])
+        if built_actions is None:
+            actions = self._build_actions_from_dicts(action_dicts)
+        else:
+            key = json.dumps(action_dicts, sort_keys=True, default=str)
+            actions = built_actions.get(key)
+            if actions is None:
+                actions = built_actions[key] = self._build_actions_from_dicts(action_dicts)
+            actions = list(actions)
+
+        return Monster(
+            name=monster_data.get('name', 'Unknown'),
+            challenge_rating=monster_data.get('cr', '1/4'),
+            hp=monster_data.get('hp', 10),
+            ac=monster_data.get('ac', 10),
+            ability_scores=monster_data.get('ability_scores', DEFAULT_ABILITY_SCORES),
+            damage_resistances=monster_data.get('damage_resistances', []),
+            damage_immunities=monster_data.get('damage_immunities', []),
+            special_abilities=monster_data.get('special_abilities', []),
+            legendary_actions=monster_data.get('legendary_actions', []),
+            multiattack=monster_data.get('multiattack', False),
+            actions=actions
+        )
+
     def _load_character_cache(self):
         """
         Load and cache character data from characters.json for fast lookups.
         Creates an indexed cache: {(name, class, level): character_data}
         """
+        self._resolved_spells = {}  # tuple of spell names -> {name: Spell}
         try:
-            with open('data/characters.json', 'r') as f:
-                characters_data = json.load(f)
-
-            self.character_cache = {}
-            for level_data in characters_data:
-                level = level_data.get('level')
-                for char in level_data.get('party', []):
-                    cache_key = (
-                        char.get('name'),
-                        char.get('character_class'),
-                        level
-                    )
-                    self.character_cache[cache_key] = char
+            self.character_cache = _read_character_index(
+                CHARACTERS_FILE, os.stat(CHARACTERS_FILE).st_mtime_ns
+            )
         except Exception as e:
             log_exception(e)
             self.character_cache = {}
 
+    def _resolve_spells(self, spell_names: List[str]) -> Dict[str, Any]:
+        """Look up the Spell objects for a spell list by name, memoized per distinct list."""
+        key = tuple(spell_names)
+        spells = self._resolved_spells.get(key)
+        if spells is None:
+            spells = {spell.name: spell for spell in self.spell_manager.get_spells(key)}
+            self._resolved_spells[key] = spells
+        return spells
+
     def _load_full_character_data(self, char_data):
         """
         Load full character data from cache based on name, class, and level.
@@ -327,18 +605,40 @@ class BatchSimulationController:
     def get_batch_progress(self, batch_id: int) -> Dict[str, Any]:
         """
         Get the current progress of a batch simulation.
+
+        'queued' is True while the batch waits for a free worker; a worker
+        that ended without recording its outcome is reported as an error.
+
+        Workers publish whole new state dicts and never modify one once it
+        is published, so this returns the published snapshot itself, without
+        taking the state lock or copying it. Callers must not modify it.
         """
-        with self.state_lock:
-            return self.batch_states.get(batch_id, {
-                'progress': 0,
-                'completed_runs': 0,
-                'failed_runs': 0,
-                'total_runs': 0,
-                'party_wins': 0,
-                'monster_wins': 0,
-                'done': False,
-                'error': None
-            }).copy()  # Return a copy to avoid external modifications
+        state = self.batch_states.get(batch_id)
+        if state is None:
+            return _UNKNOWN_BATCH_PROGRESS
+
+        future = self.batch_futures.get(batch_id)
+        if future is not None and future.done() and not state.get('done'):
+            if future.cancelled():
+                error = 'Batch was cancelled before it started'
+            else:
+                exc = future.exception()
+                error = str(exc) if exc else 'Batch worker stopped without finishing'
+            state = dict(state, error=error, queued=False, done=True)
+        return state
+
+    def wait_for_batch(self, batch_id: int, timeout: Optional[float] = None) -> bool:
+        """
+        Block until a batch has finished, instead of polling get_batch_progress.
+
+        Returns False if the timeout expired first; batches with no worker
+        (unknown or already cleaned up) count as finished.
+        """
+        future = self.batch_futures.get(batch_id)
+        if future is None:
+            return True
+        done, _ = wait([future], timeout=timeout)
+        return future in done
 
     def get_batch_results(self, batch_id: int) -> Dict[str, Any]:
         """
@@ -390,9 +690,9 @@ class BatchSimulationController:
                 # Remove state
                 if batch_id in self.batch_states:
                     del self.batch_states[batch_id]
-                # Remove thread reference
-                if batch_id in self.batch_threads:
-                    del self.batch_threads[batch_id]
+                # Remove future reference
+                if batch_id in self.batch_futures:
+                    del self.batch_futures[batch_id]
 
     def cleanup_completed_batches(self):
         """
@@ -409,15 +709,32 @@ class BatchSimulationController:
         for batch_id in completed_ids:
             self.cleanup_batch(batch_id)
 
-    def shutdown(self):
+    def shutdown(self, timeout: Optional[float] = None):
         """
-        Gracefully shutdown by waiting for all batch threads to complete.
+        Gracefully shutdown by waiting for queued and running batches to complete.
         Call this before application exit.
-        """
-        with self.state_lock:
-            thread_ids = list(self.batch_threads.keys())
 
-        for batch_id in thread_ids:
-            thread = self.batch_threads.get(batch_id)
-            if thread and thread.is_alive():
-                thread.join(timeout=30)  # Wait max 30 seconds per thread 
\ No newline at end of file
+        With a timeout, batches still queued are cancelled and running ones
+        get at most that many seconds. Any still going are then told to stop
+        after their current run, and the run pool is terminated instead of
+        drained once they have returned.
+        """
+        if timeout is None:
+            self.executor.shutdown(wait=True)
+            finished = True
+        else:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            # Cancelled futures never count as done for wait(), so leave them out
+            started = [f for f in self.batch_futures.values() if not f.cancelled()]
+            _, not_done = wait(started, timeout=timeout)
+            finished = not not_done
+            if not_done:
+                self.stopping.set()
+                wait(not_done)
+        if self.run_pool is not None:
+            if finished:
+                self.run_pool.close()
+            else:
+                self.run_pool.terminate()
+            self.run_pool.join()
+            self.run_pool = None
@@ -1,7 +1,7 @@
 from models.encounter_builder import EncounterBuilder
 from flask import session
+from flask.sessions import SecureCookieSession
 import json
-import copy
 import logging
 from typing import Dict, List, Any, Optional
 from utils.exceptions import ValidationError, APIError
@@ -18,6 +18,20 @@ MAX_PARTY_SIZE = 10
 logger = logging.getLogger(__name__)
 
 
+def _fast_deepcopy(obj: Any) -> Any:
+    """
+    Deep-copy JSON-shaped data (dicts, lists and immutable scalars).
+
+    Much cheaper than copy.deepcopy, which goes through the full copy
+    protocol and memo bookkeeping for every node.
+    """
+    if type(obj) is dict:
+        return {key: _fast_deepcopy(value) for key, value in obj.items()}
+    if type(obj) is list:
+        return [_fast_deepcopy(value) for value in obj]
+    return obj
+
+
 class EncounterController:
     """
     Controller for managing encounter creation and validation.
@@ -35,6 +49,10 @@ class EncounterController:
         self.builder = EncounterBuilder(monsters_file=monsters_file)
         self.templates_file = templates_file
         self.templates = []
+        self._templates_by_name: Dict[str, Dict[str, Any]] = {}
+        # Monsters built from each template, so prebuilt encounters keep only the
+        # template name in the session: template name -> monster list
+        self._template_monsters: Dict[str, List[Dict[str, Any]]] = {}
         self._load_templates()
 
     def _load_templates(self) -> None:
@@ -60,6 +78,13 @@ class EncounterController:
             logger.error(f"Failed to load templates: {e}")
             self.templates = []
 
+        # Index by name for prebuilt lookups; the first template wins on duplicate names
+        self._templates_by_name = {}
+        for template in self.templates:
+            name = template.get("name")
+            if name:
+                self._templates_by_name.setdefault(name, template)
+
     def _clear_encounter_session_data(self) -> None:
         """
         Clear all encounter and simulation related session data.
@@ -121,7 +146,7 @@ class EncounterController:
         # Input validation
         self._validate_encounter_inputs(party_level, party_size, monster_list)
 
-        logger.info(f"Creating custom encounter: {len(monster_list)} monsters, party level {party_level}, size {party_size}")
+        logger.debug(f"Creating custom encounter: {len(monster_list)} monsters, party level {party_level}, size {party_size}")
 
         # Clear session data
         self._clear_encounter_session_data()
@@ -130,10 +155,15 @@ class EncounterController:
         balance = self.validate_encounter_balance(monster_list, party_level, party_size)
         warnings = self.generate_encounter_warnings(monster_list, party_level, party_size)
 
-        # Store in session with deep copy to prevent mutation issues
-        session['encounter_monsters'] = copy.deepcopy(monster_list)
+        # Cookie sessions serialize on save, which already isolates the stored data
+        # from the caller's list; only other session backends need a copy.
+        # Callers must not modify monster_list afterwards in this request.
+        if isinstance(session, SecureCookieSession):
+            session['encounter_monsters'] = monster_list
+        else:
+            session['encounter_monsters'] = _fast_deepcopy(monster_list)
 
-        logger.info(f"Custom encounter created successfully with balance: {balance}")
+        logger.info(f"Custom encounter created successfully with {len(monster_list)} monsters, balance: {balance}")
 
         return {"balance": balance, "warnings": warnings, "monsters": monster_list}
 
@@ -164,20 +194,20 @@ class EncounterController:
         if len(template_name) > 200:
             raise ValidationError("template_name is too long")
 
-        logger.info(f"Creating prebuilt encounter: '{template_name}', party level {party_level}, size {party_size}")
+        logger.debug(f"Creating prebuilt encounter: '{template_name}', party level {party_level}, size {party_size}")
 
         # Clear session data
         self._clear_encounter_session_data()
 
         # Find template in cached templates
-        template = next((t for t in self.templates if t.get("name") == template_name), None)
+        template = self._find_template(template_name)
         if not template:
             logger.warning(f"Template '{template_name}' not found")
             raise ValidationError(f"Template '{template_name}' not found")
 
         # Create encounter from template
         try:
-            monsters = self.builder.create_encounter_from_template(template)
+            monsters = self._monsters_for_template(template)
         except ValueError as e:
             log_exception(e)
             raise ValidationError(f"Encounter creation failed: {e}")
@@ -186,22 +216,56 @@ class EncounterController:
         balance = self.validate_encounter_balance(monsters, party_level, party_size)
         warnings = self.generate_encounter_warnings(monsters, party_level, party_size)
 
-        # Store in session with deep copy
-        session['encounter_monsters'] = copy.deepcopy(monsters)
+        # Only the template name goes in the session; the monsters are rebuilt
+        # from it on read instead of riding along in every session cookie
         session['selected_encounter'] = template_name
 
         logger.info(f"Prebuilt encounter '{template_name}' created successfully with {len(monsters)} monsters, balance: {balance}")
 
         return {"balance": balance, "warnings": warnings, "monsters": monsters, "template": template}
 
+    def _find_template(self, template_name: str) -> Optional[Dict[str, Any]]:
+        """Return the cached template with the given name, or None."""
+        return self._templates_by_name.get(template_name)
+
+    def _monsters_for_template(self, template: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Build the monsters for a template once per process and reuse them.
+
+        Raises:
+            ValueError: If the template's monsters cannot be found
+        """
+        name = template.get("name")
+        monsters = self._template_monsters.get(name)
+        if monsters is None:
+            monsters = self.builder.create_encounter_from_template(template)
+            self._template_monsters[name] = monsters
+        return monsters
+
     def get_current_encounter_monsters(self) -> List[Dict[str, Any]]:
         """
         Get the current encounter monsters from the session.
 
+        Custom encounters are stored in the session itself; prebuilt ones
+        store only the template name and are rebuilt from the template.
+
         Returns:
             List of monster dictionaries, or empty list if none stored
         """
-        return session.get('encounter_monsters', [])
+        monsters = session.get('encounter_monsters')
+        if monsters is not None:
+            return monsters
+
+        template_name = session.get('selected_encounter')
+        template = self._find_template(template_name) if template_name else None
+        if not template:
+            return []
+        try:
+            # Copies, so callers can't alter the monsters other sessions share
+            return [dict(m) for m in self._monsters_for_template(template)]
+        except ValueError as e:
+            log_exception(e)
+            return []
 
     def validate_encounter_balance(self, monsters: List[Dict[str, Any]], party_level: int, party_size: int) -> str:
         """
@@ -1,56 +1,100 @@
+import re
 from models.db import DatabaseManager
 from collections import defaultdict
 from utils.exceptions import DatabaseError, ValidationError
 from utils.logging import log_exception
 
+# Action types whose damage counts as damage dealt
+_DAMAGE_ACTIONS = frozenset({'attack', 'spell', 'special'})
+
+# A name ending in an instance number, e.g. "Kobold 1"
+_BASE_NAME_RE = re.compile(r'^(.+?)\s+\d+$')
+
 class ResultsController:
-    def __init__(self):
-        self.db = DatabaseManager()
+    def __init__(self, db=None):
+        self.db = db or DatabaseManager()
+
+    def _format_simulation(self, sim):
+        """Format a simulation row for the results template."""
+        if sim:
+            return {
+                'win_loss': sim.get('result', 'Unknown'),
+                'party_status': f"Rounds: {sim.get('rounds', 0)}, HP Remaining: {sim.get('party_hp_remaining', 0)}",
+                'encounter_type': sim.get('encounter_type', 'Unknown'),
+                'party_level': sim.get('party_level', 0),
+                'created_at': sim.get('created_at', ''),
+                'id': sim.get('id', 0)
+            }
+        return {
+            'win_loss': 'No data',
+            'party_status': 'No data',
+            'encounter_type': 'Unknown',
+            'party_level': 0,
+            'created_at': '',
+            'id': 0
+        }
 
     def format_simulation_results(self, sim_id):
         try:
             sim = self.db.get_simulation(sim_id)
             logs = self.db.get_combat_logs(sim_id)
             
-            # Format simulation data for template
-            if sim:
-                formatted_sim = {
-                    'win_loss': sim.get('result', 'Unknown'),
-                    'party_status': f"Rounds: {sim.get('rounds', 0)}, HP Remaining: {sim.get('party_hp_remaining', 0)}",
-                    'encounter_type': sim.get('encounter_type', 'Unknown'),
-                    'party_level': sim.get('party_level', 0),
-                    'created_at': sim.get('created_at', ''),
-                    'id': sim.get('id', 0)
-                }
-            else:
-                formatted_sim = {
-                    'win_loss': 'No data',
-                    'party_status': 'No data',
-                    'encounter_type': 'Unknown',
-                    'party_level': 0,
-                    'created_at': '',
-                    'id': 0
-                }
-            
-            return {'simulation': formatted_sim, 'logs': logs}
+            return {'simulation': self._format_simulation(sim), 'logs': logs}
         except Exception as e:
             log_exception(e)
             raise DatabaseError(f"Failed to format simulation results: {e}")
 
+    def get_results_bundle(self, sim_id):
+        """
+        Get everything the results page needs with one database round-trip.
+
+        Returns the formatted simulation, its combat logs and the statistics
+        computed from those same logs.
+        """
+        try:
+            data = self.db.get_simulation_with_logs(sim_id)
+        except Exception as e:
+            log_exception(e)
+            raise DatabaseError(f"Failed to load simulation results: {e}")
+
+        logs = data['logs']
+        return {
+            'simulation': self._format_simulation(data['simulation']),
+            'logs': logs,
+            'statistics': self._aggregate_statistics(logs)
+        }
+
     def generate_combat_statistics(self, sim_id):
         try:
             logs = self.db.get_combat_logs(sim_id)
-            
-            stats = defaultdict(lambda: {
-                'name': '',
-                'damage_dealt': 0,
-                'damage_taken': 0,
-                'spells_cast': 0,
-                'crits': 0,
-                'misses': 0,
-                'healing': 0,
-                'rounds': defaultdict(dict),
-            })
+        except Exception as e:
+            log_exception(e)
+            raise ValidationError(f"Failed to generate combat statistics: {e}")
+        return self._aggregate_statistics(logs)
+
+    def _aggregate_statistics(self, logs):
+        """Aggregate per-combatant statistics from combat log rows."""
+        try:
+            stats = {}
+
+            def _ensure(key):
+                """Return the stats entry for key, creating it on first sight."""
+                entity = stats.get(key)
+                if entity is None:
+                    entity = stats[key] = {
+                        'name': key,
+                        'damage_dealt': 0,
+                        'damage_taken': 0,
+                        'spells_cast': 0,
+                        'crits': 0,
+                        'misses': 0,
+                        'healing': 0,
+                        'rounds': {},
+                    }
+                return entity
+
+            # Per-round totals keyed flat by (entity, round), folded into stats after the loop
+            round_stats = defaultdict(dict)
             
             for log in logs:
                 actor = log['character_name']
@@ -59,18 +103,20 @@ class ResultsController:
                 result = log['result']
                 damage = log['damage'] or 0
                 round_num = log['round_number']
+                # Lower-case the result once for the crit/miss/heal checks below
+                result_lc = result.lower() if result else ''
                 
                 # Keep individual monsters separate (e.g., "Kobold 1", "Kobold 2" stay distinct)
                 actor_key = actor
                 target_key = target if target else None
                 
-                # Set name
-                stats[actor_key]['name'] = actor_key
+                actor_stats = _ensure(actor_key)
                 
                 # Damage dealt
-                if action_type in ('attack', 'spell', 'special') and damage > 0:
-                    stats[actor_key]['damage_dealt'] += damage
-                    stats[actor_key]['rounds'][round_num]['damage_dealt'] = stats[actor_key]['rounds'][round_num].get('damage_dealt', 0) + damage
+                if action_type in _DAMAGE_ACTIONS and damage > 0:
+                    actor_stats['damage_dealt'] += damage
+                    actor_round = round_stats[(actor_key, round_num)]
+                    actor_round['damage_dealt'] = actor_round.get('damage_dealt', 0) + damage
                 
                 # Damage taken
                 if target_key and damage > 0:
@@ -78,31 +124,39 @@ class ResultsController:
                     if ', ' in target_key:
                         # Split targets and distribute damage evenly
                         targets = [t.strip() for t in target_key.split(',')]
-                        damage_per_target = damage // len(targets) if len(targets) > 0 else damage
+                        # split() always yields at least one element, so len(targets) is never zero
+                        damage_per_target = damage // len(targets)
                         for individual_target in targets:
-                            stats[individual_target]['name'] = individual_target
-                            stats[individual_target]['damage_taken'] += damage_per_target
-                            stats[individual_target]['rounds'][round_num]['damage_taken'] = stats[individual_target]['rounds'][round_num].get('damage_taken', 0) + damage_per_target
+                            target_stats = _ensure(individual_target)
+                            target_stats['damage_taken'] += damage_per_target
+                            target_round = round_stats[(individual_target, round_num)]
+                            target_round['damage_taken'] = target_round.get('damage_taken', 0) + damage_per_target
                     else:
                         # Single target
-                        stats[target_key]['name'] = target_key  # Set target name
-                        stats[target_key]['damage_taken'] += damage
-                        stats[target_key]['rounds'][round_num]['damage_taken'] = stats[target_key]['rounds'][round_num].get('damage_taken', 0) + damage
+                        target_stats = _ensure(target_key)
+                        target_stats['damage_taken'] += damage
+                        target_round = round_stats[(target_key, round_num)]
+                        target_round['damage_taken'] = target_round.get('damage_taken', 0) + damage
                 
                 # Spells cast
                 if action_type == 'spell':
-                    stats[actor_key]['spells_cast'] += 1
+                    actor_stats['spells_cast'] += 1
                 
                 # Crits/misses
-                if 'crit' in (result or '').lower():
-                    stats[actor_key]['crits'] += 1
-                if 'miss' in (result or '').lower():
-                    stats[actor_key]['misses'] += 1
+                if 'crit' in result_lc:
+                    actor_stats['crits'] += 1
+                if 'miss' in result_lc:
+                    actor_stats['misses'] += 1
                 
                 # Healing
-                if action_type == 'spell' and 'heal' in (result or '').lower():
-                    stats[actor_key]['healing'] += abs(damage)
-                    stats[actor_key]['rounds'][round_num]['healing'] = stats[actor_key]['rounds'][round_num].get('healing', 0) + abs(damage)
+                if action_type == 'spell' and 'heal' in result_lc:
+                    healed = abs(damage)
+                    actor_stats['healing'] += healed
+                    actor_round = round_stats[(actor_key, round_num)]
+                    actor_round['healing'] = actor_round.get('healing', 0) + healed
+
+            for (entity, round_num), totals in round_stats.items():
+                stats[entity]['rounds'][round_num] = totals
             
             # Flatten stats for table
             result_stats = list(stats.values())
@@ -120,8 +174,7 @@ class ResultsController:
             return name
         
         # Check if the name ends with a number (e.g., "Kobold 1", "Goblin 2", "Wolf 3")
-        import re
-        match = re.match(r'^(.+?)\s+\d+$', name)
+        match = _BASE_NAME_RE.match(name)
         if match:
             return match.group(1)
         
@@ -136,6 +189,10 @@ class ResultsController:
             log_exception(e)
             raise DatabaseError(f"Failed to get detailed log: {e}")
 
+    def iter_detailed_log(self, sim_id):
+        """Yield combat log rows one at a time for streaming responses."""
+        return self.db.iter_combat_logs(sim_id)
+
     def manage_result_navigation(self, action):
         try:
             # TODO: Implement navigation logic
@@ -1,6 +1,9 @@
-import threading
 import json
+import os
+import threading
 import logging
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from typing import Dict, List, Any, Optional, Tuple
 from flask import session
 from models.combat import Combat
@@ -10,6 +13,7 @@ from models.monster import Monster
 from models.spell_manager import SpellManager
 from utils.exceptions import SimulationError, ValidationError
 from utils.logging import log_exception
+from utils.party_loader import read_json_file
 from models.actions import AttackAction, Action
 
 # Constants
@@ -18,6 +22,7 @@ DEFAULT_CHARACTER_LEVEL = 1
 DEFAULT_HP = 10
 DEFAULT_AC = 10
 DEFAULT_PROFICIENCY_BONUS = 2
+# Shared by every build; Character and Monster copy the scores they are given
 DEFAULT_ABILITY_SCORES = {'str': 10, 'dex': 10, 'con': 10, 'int': 10, 'wis': 10, 'cha': 10}
 DEFAULT_DAMAGE_DICE = '1d6'
 DEFAULT_DAMAGE_TYPE = 'bludgeoning'
@@ -30,6 +35,9 @@ MAX_PARTY_LEVEL = 20
 MAX_PARTY_SIZE = 20
 MAX_MONSTER_COUNT = 100
 CHARACTERS_DATA_FILE = 'data/characters.json'
+COMBATANT_TEMPLATE_CACHE_SIZE = 32
+# Simulations beyond this many wait for a free worker thread instead of each getting a new one
+MAX_CONCURRENT_SIMULATIONS = int(os.environ.get('SIMULATION_WORKERS', os.cpu_count() or 4))
 
 logger = logging.getLogger(__name__)
 
@@ -40,26 +48,40 @@ class SimulationController:
     Handles character/monster conversion, combat execution, and result persistence.
     """
 
-    def __init__(self):
-        """Initialize the simulation controller with caching and thread safety."""
-        self.db = DatabaseManager()
-        self.spell_manager = SpellManager()
-        self.simulation_threads: Dict[str, threading.Thread] = {}  # session_id -> thread
+    def __init__(self, db: Optional[DatabaseManager] = None, spell_manager: Optional[SpellManager] = None):
+        """
+        Initialize the simulation controller with caching and thread safety.
+
+        Args:
+            db: Shared database manager; a new one is created if omitted
+            spell_manager: Shared spell manager; a new one is created if omitted
+        """
+        self.db = db or DatabaseManager()
+        self.spell_manager = spell_manager or SpellManager()
+        self.executor: Optional[ThreadPoolExecutor] = None  # Worker pool, started on first simulation
+        self.simulation_futures: Dict[str, Future] = {}  # session_id -> Future
         self.simulation_states: Dict[str, Dict[str, Any]] = {}   # session_id -> state dict
         self.state_lock = threading.Lock()  # Thread safety for shared state
         self.character_cache: Optional[Dict[Tuple[str, str, int], Dict[str, Any]]] = None
+        # (name, class) -> [(level, character_data)] sorted by level, unknown levels last
+        self._character_levels: Dict[Tuple[str, str], List[Tuple[Optional[int], Dict[str, Any]]]] = {}
+        self._characters_mtime: Optional[int] = None
+        # Built combatants for recently simulated party/encounter pairs; every
+        # simulation fights on clones: JSON signature -> [Character/Monster]
+        self._combatant_templates: 'OrderedDict[str, List[Any]]' = OrderedDict()
         self._load_character_cache()
 
     def _load_character_cache(self) -> None:
         """
         Load and cache character data from characters.json for fast lookups.
-        Creates an indexed cache: {(name, class, level): character_data}
+        Creates an indexed cache: {(name, class, level): character_data},
+        plus each character's levels in order for best-level lookups.
         """
         try:
-            with open(CHARACTERS_DATA_FILE, 'r') as f:
-                characters_data = json.load(f)
+            mtime = os.stat(CHARACTERS_DATA_FILE).st_mtime_ns
+            characters_data = read_json_file(CHARACTERS_DATA_FILE)
 
-            self.character_cache = {}
+            character_cache = {}
             for level_data in characters_data:
                 level = level_data.get('level')
                 for char in level_data.get('party', []):
@@ -68,12 +90,36 @@ class SimulationController:
                         char.get('character_class'),
                         level
                     )
-                    self.character_cache[cache_key] = char
+                    character_cache[cache_key] = char
+
+            character_levels = {}
+            for (name, char_class, level), char in character_cache.items():
+                character_levels.setdefault((name, char_class), []).append((level, char))
+            for entries in character_levels.values():
+                entries.sort(key=lambda entry: entry[0] if entry[0] is not None else 999)
+
+            # Swap in complete indexes so simulation threads never see a partial load
+            self.character_cache = character_cache
+            self._character_levels = character_levels
+            self._characters_mtime = mtime
+            # Templates built from the old data are stale
+            with self.state_lock:
+                self._combatant_templates.clear()
             logger.info(f"Loaded {len(self.character_cache)} character entries into cache")
         except Exception as e:
             log_exception(e)
             logger.warning(f"Failed to load character cache: {e}")
             self.character_cache = {}
+            self._character_levels = {}
+
+    def _refresh_character_cache(self) -> None:
+        """Reload the character cache if characters.json changed since it was loaded."""
+        try:
+            mtime = os.stat(CHARACTERS_DATA_FILE).st_mtime_ns
+        except OSError:
+            return
+        if mtime != self._characters_mtime:
+            self._load_character_cache()
 
     def _validate_simulation_inputs(
         self,
@@ -190,11 +236,8 @@ class SimulationController:
 
         logger.debug(f"Looking up character: name='{char_name}', class='{char_class}', level={char_level}")
 
-        # Gather all matching entries for this name/class
-        matches = []
-        for (cache_name, cache_class, cache_level), char in self.character_cache.items():
-            if cache_name == char_name and cache_class == char_class:
-                matches.append((cache_level, char))
+        # All entries for this name/class, lowest level first
+        matches = self._character_levels.get((char_name, char_class))
 
         if not matches:
             logger.warning(f"No match found for character: name='{char_name}', class='{char_class}'")
@@ -204,16 +247,17 @@ class SimulationController:
         best = None
         best_level = -1
         for lvl, char in matches:
-            if lvl is not None and lvl <= char_level and lvl > best_level:
-                best = char
-                best_level = lvl
+            if lvl is None or lvl > char_level:
+                break
+            best = char
+            best_level = lvl
 
         if best:
             logger.debug(f"Found best match for {char_name} at level {best_level}")
             return best
 
         # Fallback: return the lowest available level
-        min_level, min_char = min(matches, key=lambda x: x[0] if x[0] is not None else 999)
+        min_level, min_char = matches[0]
         logger.debug(f"Using fallback match for {char_name} at level {min_level}")
         return min_char
 
@@ -282,10 +326,8 @@ class SimulationController:
                 )
 
                 # Add spells to character
-                for spell_name in full_char_data.get('spell_list', []):
-                    spell = self.spell_manager.get_spell(spell_name)
-                    if spell:
-                        char.add_spell(spell)
+                for spell in self.spell_manager.get_spells(full_char_data.get('spell_list', [])):
+                    char.add_spell(spell)
 
                 character_objects.append(char)
             else:
@@ -344,6 +386,42 @@ class SimulationController:
 
         return monster_objects
 
+    def _build_combatants(self, party: List[Any], monsters: List[Any], party_level: int) -> List[Any]:
+        """
+        Build the combatants for one simulation.
+
+        Parties and encounters given as plain data are built once and cached by
+        their JSON signature; each simulation gets fresh clones of the cached
+        templates. Inputs containing model objects are converted every time.
+
+        Args:
+            party: List of character data (dicts or Character objects)
+            monsters: List of monster data (dicts or Monster objects)
+            party_level: Level to use for all party members
+
+        Returns:
+            List of Character objects followed by Monster objects
+        """
+        # One stat per simulation picks up edits to characters.json (clearing the
+        # templates built from it) without a restart
+        self._refresh_character_cache()
+        try:
+            key = json.dumps([party, monsters, party_level], sort_keys=True)
+        except TypeError:
+            return self._convert_party_to_characters(party, party_level) + self._convert_monsters_to_objects(monsters)
+
+        with self.state_lock:
+            templates = self._combatant_templates.get(key)
+            if templates is not None:
+                self._combatant_templates.move_to_end(key)
+        if templates is None:
+            templates = self._convert_party_to_characters(party, party_level) + self._convert_monsters_to_objects(monsters)
+            with self.state_lock:
+                self._combatant_templates[key] = templates
+                while len(self._combatant_templates) > COMBATANT_TEMPLATE_CACHE_SIZE:
+                    self._combatant_templates.popitem(last=False)
+        return [template.clone() for template in templates]
+
     def _run_simulation_thread(
         self,
         party: List[Any],
@@ -363,14 +441,13 @@ class SimulationController:
         try:
             logger.info(f"Starting simulation thread for session {session_id}, party level {party_level}")
 
-            # Convert party and monsters to objects
-            character_objects = self._convert_party_to_characters(party, party_level)
-            monster_objects = self._convert_monsters_to_objects(monsters)
+            # Convert party and monsters to objects (cloned from cached templates when possible)
+            combatants = self._build_combatants(party, monsters, party_level)
 
-            logger.info(f"Simulation setup: {len(character_objects)} characters vs {len(monster_objects)} monsters")
+            logger.info(f"Simulation setup: {len(combatants)} combatants")
 
             # Create combat with proper objects
-            combat = Combat(character_objects + monster_objects)
+            combat = Combat(combatants)
 
             def progress_callback(state: Dict[str, Any]) -> None:
                 with self.state_lock:
@@ -420,7 +497,7 @@ class SimulationController:
         party_level: int = DEFAULT_PARTY_LEVEL
     ) -> None:
         """
-        Execute a combat simulation in a background thread.
+        Execute a combat simulation on the simulation worker pool.
 
         Args:
             party: List of character data (dicts or Character objects)
@@ -436,13 +513,13 @@ class SimulationController:
 
         logger.info(f"Executing simulation for session {session_id}: {len(party)} party members at level {party_level} vs {len(monsters)} monsters")
 
-        # Initialize state before starting thread (prevents race condition)
+        # Initialize state before queueing the run (prevents race condition)
         with self.state_lock:
-            # Clear any existing simulation state and thread for this session
+            # Clear any existing simulation state and future for this session
             if session_id in self.simulation_states:
                 del self.simulation_states[session_id]
-            if session_id in self.simulation_threads:
-                del self.simulation_threads[session_id]
+            if session_id in self.simulation_futures:
+                del self.simulation_futures[session_id]
 
             # Set initial state
             self.simulation_states[session_id] = {
@@ -451,17 +528,25 @@ class SimulationController:
                 'done': False
             }
 
-        # Create and start thread
-        t = threading.Thread(
-            target=self._run_simulation_thread,
-            args=(party, monsters, session_id, party_level)
-        )
-        t.daemon = True  # Allow program to exit even if thread is running
+        # Queue on the shared worker pool; reused threads, bounded concurrency
+        future = self._get_executor().submit(self._run_simulation_thread, party, monsters, session_id, party_level)
 
         with self.state_lock:
-            self.simulation_threads[session_id] = t
+            self.simulation_futures[session_id] = future
 
-        t.start()
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """
+        Return the simulation worker pool, starting it on first use.
+
+        Creating it here rather than at import means its queue and locks are
+        built after any monkey-patching (e.g. gevent) the server applies.
+        """
+        with self.state_lock:
+            if self.executor is None:
+                self.executor = ThreadPoolExecutor(
+                    max_workers=MAX_CONCURRENT_SIMULATIONS, thread_name_prefix='simulation'
+                )
+            return self.executor
 
     def get_simulation_id(self, session_id: str) -> Optional[int]:
         """
@@ -490,13 +575,16 @@ class SimulationController:
         """
         session_id = session['session_id']
         with self.state_lock:
-            logger.info(f"handle_simulation_progress: session_id={session_id}, available_sessions={list(self.simulation_states.keys())}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "handle_simulation_progress: session_id=%s, available_sessions=%s",
+                    session_id, list(self.simulation_states.keys())
+                )
             state = self.simulation_states.get(session_id, {
                 'progress': 0,
                 'log': [],
                 'done': False
             })
-            logger.info(f"handle_simulation_progress: returning state={state}")
             return state.copy()  # Return copy to prevent external modifications
 
     def save_simulation_results(self, result: Dict[str, Any], session_id: str) -> int:
@@ -515,7 +603,7 @@ class SimulationController:
         """
         try:
             # Ensure session exists in database before saving simulation results
-            self.db.create_session(session_id)
+            self.db.ensure_session(session_id)
 
             sim_id = self.db.save_simulation_result(session_id, result)
             logger.info(f"Saved simulation results as ID {sim_id} for session {session_id}")
@@ -554,9 +642,9 @@ class SimulationController:
                     del self.simulation_states[session_id]
                     logger.debug(f"Cleaned up simulation state for session {session_id}")
 
-            if session_id in self.simulation_threads:
-                del self.simulation_threads[session_id]
-                logger.debug(f"Cleaned up simulation thread for session {session_id}")
+            if session_id in self.simulation_futures:
+                del self.simulation_futures[session_id]
+                logger.debug(f"Cleaned up simulation future for session {session_id}")
 
     def cleanup_completed_simulations(self) -> None:
         """
@@ -578,23 +666,23 @@ class SimulationController:
 
     def shutdown(self) -> None:
         """
-        Gracefully shutdown by waiting for all simulation threads to complete.
+        Gracefully shutdown by waiting for queued and running simulations to complete.
         Call this before application exit.
+
+        Simulations still queued after the 30 second wait are cancelled.
+        Running ones are left to finish; worker threads are not daemons, so
+        interpreter exit still waits for them.
         """
         with self.state_lock:
-            session_ids = list(self.simulation_threads.keys())
-
-        logger.info(f"Shutting down simulation controller, waiting for {len(session_ids)} threads")
-
-        for session_id in session_ids:
-            with self.state_lock:
-                thread = self.simulation_threads.get(session_id)
+            futures = dict(self.simulation_futures)
 
-            if thread and thread.is_alive():
-                logger.debug(f"Waiting for simulation thread {session_id} to complete")
-                thread.join(timeout=30)  # Wait max 30 seconds per thread
+        logger.info(f"Shutting down simulation controller, waiting for {len(futures)} simulations")
 
-                if thread.is_alive():
-                    logger.warning(f"Simulation thread {session_id} did not complete within timeout")
+        _, not_done = wait(futures.values(), timeout=30)  # Wait max 30 seconds overall
+        for session_id, future in futures.items():
+            if future in not_done:
+                logger.warning(f"Simulation {session_id} did not complete within timeout")
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
 
         logger.info("Simulation controller shutdown complete")
@@ -5,13 +5,40 @@ Defines the Action base class and AttackAction subclass for use by characters an
 """
 
 from typing import Any, Optional, TYPE_CHECKING
-import random
+import functools
 import re
+from models.dice import rng
 
 if TYPE_CHECKING:
     from models.character import Character
     from models.monster import Monster
 
+DICE_PATTERN = re.compile(r'^(\d+)[dD](\d+)([+-]\d+)?$')
+
+@functools.lru_cache(maxsize=256)
+def _parse_dice(dice_str: str):
+    """Parse a dice string into (num, die, mod); cached since actions reuse a handful of strings."""
+    match = DICE_PATTERN.match(dice_str.replace(' ', ''))
+    if not match:
+        raise ValueError(f"Invalid dice string: {dice_str}")
+    num = int(match.group(1))
+    die = int(match.group(2))
+    mod = int(match.group(3)) if match.group(3) else 0
+    return num, die, mod
+
+def combatant_name(combatant: Any) -> str:
+    """
+    Return a combatant's name, or its str() if it has none.
+
+    Unlike getattr(combatant, 'name', str(combatant)), str() is only built
+    when it is needed; this runs for every target of every action.
+    """
+    try:
+        return combatant.name
+    except AttributeError:
+        return str(combatant)
+
+
 class Action:
     """
     Base class for all combat actions (attack, spell, dodge, etc.).
@@ -80,14 +107,7 @@ class AttackAction(Action):
         Parse a dice string like '2d6+3', '1d4-1', '1d8', etc.
         Returns (num, die, mod)
         """
-        pattern = r'^(\d+)[dD](\d+)([+-]\d+)?$'
-        match = re.match(pattern, dice_str.replace(' ', ''))
-        if not match:
-            raise ValueError(f"Invalid dice string: {dice_str}")
-        num = int(match.group(1))
-        die = int(match.group(2))
-        mod = int(match.group(3)) if match.group(3) else 0
-        return num, die, mod
+        return _parse_dice(dice_str)
 
     def damage_roll(self, attacker: Any) -> int:
         """
@@ -98,7 +118,8 @@ class AttackAction(Action):
             int: Total damage
         """
         num, die, dice_mod = self.parse_dice(self.damage_dice)
-        rolls = [random.randint(1, die) for _ in range(num)]
+        randint = rng().randint
+        rolls = [randint(1, die) for _ in range(num)]
         # Only add ability modifier if dice_mod is zero (i.e., not already included in dice string)
         mod = 0
         if hasattr(attacker, 'ability_modifier') and dice_mod == 0:
@@ -127,9 +148,9 @@ class AttackAction(Action):
 
         # Get target name(s) for result
         if isinstance(target, list):
-            target_names = [getattr(t, 'name', str(t)) for t in target]
+            target_names = [combatant_name(t) for t in target]
         else:
-            target_names = getattr(target, 'name', str(target))
+            target_names = combatant_name(target)
 
         # Base result structure
         result = {
@@ -152,7 +173,7 @@ class AttackAction(Action):
                 base_damage = self.damage_roll(attacker)
 
                 for t in targets_list:
-                    save_roll = random.randint(1, 20)
+                    save_roll = rng().randint(1, 20)
 
                     # Calculate save bonus
                     if hasattr(t, 'saving_throw_bonus'):
@@ -179,7 +200,7 @@ class AttackAction(Action):
                     total_damage_dealt += damage
 
                     target_results.append({
-                        'target': getattr(t, 'name', str(t)),
+                        'target': combatant_name(t),
                         'save_roll': save_roll,
                         'save_bonus': save_bonus,
                         'buff_bonus': buff_bonus,
@@ -210,7 +231,7 @@ class AttackAction(Action):
                 base_damage = self.damage_roll(attacker)
 
                 for t in targets_list:
-                    attack_roll = random.randint(1, 20)
+                    attack_roll = rng().randint(1, 20)
                     total_attack = attack_roll + bonus + buff_bonus
                     target_ac = getattr(t, 'ac', 10)
                     hit = total_attack >= target_ac
@@ -222,7 +243,7 @@ class AttackAction(Action):
                         total_damage_dealt += damage
 
                     target_results.append({
-                        'target': getattr(t, 'name', str(t)),
+                        'target': combatant_name(t),
                         'attack_roll': attack_roll,
                         'total_attack': total_attack,
                         'target_ac': target_ac,
@@ -241,7 +262,7 @@ class AttackAction(Action):
 
         else:
             # Single target action (standard behavior)
-            attack_roll = random.randint(1, 20)
+            attack_roll = rng().randint(1, 20)
             bonus = self.hit_bonus(attacker)
 
             # Add buff bonuses to attack rolls
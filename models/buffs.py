@@ -6,7 +6,7 @@ Handles temporary bonuses, conditions, and other effects that modify combat.
 
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass, field
-import random
+from models.dice import rng
 
 
 @dataclass
@@ -49,7 +49,8 @@ class Buff:
                 num, die = dice_str.split('d')
                 num = int(num)
                 die = int(die)
-                rolls = [random.randint(1, die) for _ in range(num)]
+                randint = rng().randint
+                rolls = [randint(1, die) for _ in range(num)]
                 total += sum(rolls)
 
         return total
@@ -134,6 +134,29 @@ class Character:
                 )
             ]
     
+    def clone(self) -> 'Character':
+        """
+        Create a fresh copy of this character for a new combat.
+        
+        Spells, actions and other content are shared with the original since
+        combat never modifies them; hit points, spell slots and buffs are reset.
+        
+        Returns:
+            Character: A full-health copy with no buffs and all spell slots
+        """
+        # Skip __init__ and copy.copy's reduce protocol; only the attributes are needed
+        clone = object.__new__(type(self))
+        clone.__dict__.update(self.__dict__)
+        clone.buffs = BuffManager()
+        clone.reset_combat_state()
+        return clone
+    
+    def reset_combat_state(self) -> None:
+        """Restore full hit points and spell slots and drop all buffs, ready for another combat."""
+        self.hp = self.max_hp
+        self.spell_slots_remaining = self.spell_slots.copy()
+        self.buffs.clear_all()
+    
     def ability_modifier(self, ability: str) -> int:
         """
         Calculate the modifier for a given ability score.
@@ -197,8 +220,8 @@ class Character:
         """
         Roll initiative: 1d20 + dex modifier.
         """
-        import random
-        return random.randint(1, 20) + self.ability_modifier('dex')
+        from models.dice import rng
+        return rng().randint(1, 20) + self.ability_modifier('dex')
 
     def is_alive(self) -> bool:
         """
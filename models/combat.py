@@ -9,6 +9,8 @@ from utils.exceptions import SimulationError
 from utils.logging import log_exception
 from ai.strategy import PartyAIStrategy, MonsterAIStrategy
 from ai.tactical import TacticalAnalyzer
+from models.actions import combatant_name
+from models import dice
 import logging
 logger = logging.getLogger('dnd5e_combat_sim.combat')
 
@@ -28,7 +30,7 @@ class CombatLogger:
         """Log action with optimized data structure."""
         self.log.append({
             'type': 'action',
-            'actor': getattr(actor, 'name', str(actor)),
+            'actor': combatant_name(actor),
             'result': action_result,
             'round': round_number,
             'timestamp': len(self.log)  # Use index as timestamp for efficiency
@@ -51,7 +53,14 @@ class Combat:
     """
     Optimized D&D 5e combat encounter management with efficient data structures and caching.
     """
-    def __init__(self, participants: List[Any]) -> None:
+    def __init__(self, participants: List[Any], rng: Optional[random.Random] = None) -> None:
+        """
+        Set up a combat between participants.
+
+        rng, when given, is the only source of dice for run(), so a combat
+        seeded with random.Random(seed) replays exactly.
+        """
+        self.rng = rng
         self.participants: List[Any] = participants[:]
         self.initiative_order: List[Any] = []
         self.current_round: int = 1
@@ -62,6 +71,7 @@ class Combat:
         from models.monster import Monster
         self._original_characters = [p for p in participants if isinstance(p, Character)]
         self._original_monsters = [p for p in participants if isinstance(p, Monster)]
+        self._character_set = frozenset(self._original_characters)
         # Pre-allocate AI strategies
         self.ai_strategy_map = {}
         for p in participants:
@@ -72,6 +82,8 @@ class Combat:
         # Cache for initiative rolls and other calculations
         self._initiative_cache = {}
         self._alive_participants_cache = None
+        self._alive_set_cache = frozenset()
+        self._alive_sides_cache = ([], [])
         self._last_alive_check = 0
         self.tactical = TacticalAnalyzer()
 
@@ -79,9 +91,21 @@ class Combat:
         """Get alive participants with caching for efficiency."""
         if self._alive_participants_cache is None or self._last_alive_check != self.current_round:
             self._alive_participants_cache = [p for p in self.participants if p.is_alive()]
+            self._alive_set_cache = frozenset(self._alive_participants_cache)
+            # Split once per refresh so each turn's combat state is two list copies
+            characters = self._character_set
+            alive_characters, alive_others = [], []
+            for p in self._alive_participants_cache:
+                (alive_characters if p in characters else alive_others).append(p)
+            self._alive_sides_cache = (alive_characters, alive_others)
             self._last_alive_check = self.current_round
         return self._alive_participants_cache
 
+    def _get_alive_set(self) -> frozenset:
+        """Get alive participants as a set, rebuilt only with the alive cache."""
+        self._get_alive_participants()
+        return self._alive_set_cache
+
     def roll_initiative(self) -> None:
         """
         Optimized initiative rolling with caching and efficient sorting.
@@ -97,7 +121,7 @@ class Combat:
             
             # Pre-calculate dex modifier for sorting efficiency
             dex_mod = getattr(p, 'ability_modifier', lambda x: 0)('dex')
-            rolls.append((roll, dex_mod, random.random(), p))
+            rolls.append((roll, dex_mod, dice.rng().random(), p))
         
         # Sort once with all criteria
         rolls.sort(key=lambda x: (-x[0], -x[1], x[2]))
@@ -115,8 +139,7 @@ class Combat:
             return None
         start = self.current_turn
         n = len(self.initiative_order)
-        alive_participants = self._get_alive_participants()
-        alive_set = set(alive_participants)
+        alive_set = self._get_alive_set()
         
         for i in range(n):
             idx = (start + i) % n
@@ -144,17 +167,18 @@ class Combat:
 
     def _build_combat_state(self, participant: Any) -> Dict[str, Any]:
         """Build combat state efficiently with participant type checking."""
-        is_character = participant in self._original_characters
+        self._get_alive_participants()
+        alive_characters, alive_others = self._alive_sides_cache
         # Include ALL allies of the same type (including the participant itself)
         # This allows characters to heal themselves, which is valid in D&D 5e
-        allies = [p for p in self.participants if
-                 (p in self._original_characters) == is_character and p.is_alive()]
-        enemies = [p for p in self.participants if
-                   (p in self._original_characters) != is_character and p.is_alive()]
+        if participant in self._character_set:
+            allies, enemies = alive_characters, alive_others
+        else:
+            allies, enemies = alive_others, alive_characters
 
         return {
-            'allies': allies,
-            'enemies': enemies,
+            'allies': allies[:],
+            'enemies': enemies[:],
             'round': self.current_round
         }
 
@@ -274,7 +298,7 @@ class Combat:
         # Execute each attack
         attack_results = []
         total_damage = 0
-        target_name = getattr(target, 'name', str(target)) if not isinstance(target, list) else ', '.join([getattr(t, 'name', str(t)) for t in target])
+        target_name = combatant_name(target) if not isinstance(target, list) else ', '.join([combatant_name(t) for t in target])
 
         for attack_action in attacks_to_perform:
             attack_result = attack_action.execute(participant, target)
@@ -298,11 +322,10 @@ class Combat:
         """
         Check if combat is over efficiently.
         """
-        # Use cached alive participants
-        alive_participants = self._get_alive_participants()
-        alive_set = set(alive_participants)
-        all_characters_down = all(p not in alive_set for p in self._original_characters)
-        all_monsters_down = all(p not in alive_set for p in self._original_monsters)
+        # Use cached alive participants; this runs several times per turn
+        alive_set = self._get_alive_set()
+        all_characters_down = alive_set.isdisjoint(self._original_characters)
+        all_monsters_down = alive_set.isdisjoint(self._original_monsters)
         return all_characters_down or all_monsters_down
 
     def get_current_participant(self) -> Optional[Any]:
@@ -324,6 +347,11 @@ class Combat:
         """
         Optimized combat simulation with efficient progress tracking.
         """
+        with dice.using(self.rng):
+            return self._run(progress_callback)
+
+    def _run(self, progress_callback=None) -> dict:
+        """Run the combat to its end on the current dice source."""
         try:
             self.roll_initiative()
             max_rounds = 50  # Prevent infinite loops
@@ -357,12 +385,11 @@ class Combat:
                 })
             
             # Determine winner efficiently
-            alive_participants = self._get_alive_participants()
-            alive_set = set(alive_participants)
+            alive_set = self._get_alive_set()
             
-            if all(p not in alive_set for p in self._original_characters):
+            if alive_set.isdisjoint(self._original_characters):
                 winner = 'monsters'
-            elif all(p not in alive_set for p in self._original_monsters):
+            elif alive_set.isdisjoint(self._original_monsters):
                 winner = 'party'
             else:
                 winner = 'unknown'
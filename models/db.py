@@ -1,17 +1,23 @@
 import sqlite3
 import os
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Iterator, Tuple
 from contextlib import contextmanager
+import threading
 import time
 from utils.exceptions import DatabaseError
 from utils.logging import log_exception
 
+# Rows per fetchmany() call when streaming large result sets
+FETCH_BATCH_SIZE = 1024
+
 class DatabaseManager:
     """
     Manages SQLite database operations with optimized queries and connection pooling.
     """
     def __init__(self, db_path: str = "dnd5e_sim.db"):
         self.db_path = db_path
+        # Per-thread holder for a connection shared across one request
+        self._scope = threading.local()
         self._ensure_db_directory()
         self._init_database()
         self._create_indexes()
@@ -39,6 +45,8 @@ class DatabaseManager:
             "CREATE INDEX IF NOT EXISTS idx_simulations_session_id ON simulations(session_id)",
             "CREATE INDEX IF NOT EXISTS idx_combat_logs_simulation_id ON combat_logs(simulation_id)",
             "CREATE INDEX IF NOT EXISTS idx_simulations_created_at ON simulations(created_at)",
+            "CREATE INDEX IF NOT EXISTS idx_combat_logs_sim_action ON combat_logs(simulation_id, action_type)",
+            "CREATE INDEX IF NOT EXISTS idx_batch_runs_batch ON batch_simulation_runs(batch_id)",
         ]
         try:
             with self._get_connection() as conn:
@@ -48,22 +56,51 @@ class DatabaseManager:
             log_exception(e)
             # Don't fail if indexes already exist
     
-    @contextmanager
-    def _get_connection(self):
-        """Get database connection with optimized settings."""
+    def _connect(self) -> sqlite3.Connection:
+        """Open a new connection with optimized settings."""
         conn = sqlite3.connect(self.db_path, timeout=20.0)
         conn.row_factory = sqlite3.Row  # Enable dict-like access
         # Enable foreign keys and optimize for performance
         conn.execute("PRAGMA foreign_keys = ON")
         conn.execute("PRAGMA journal_mode = WAL")
         conn.execute("PRAGMA synchronous = NORMAL")
-        conn.execute("PRAGMA cache_size = 10000")
+        conn.execute("PRAGMA cache_size = -65536")  # 64 MiB page cache
+        conn.execute("PRAGMA mmap_size = 268435456")  # 256 MiB memory-mapped reads
         conn.execute("PRAGMA temp_store = MEMORY")
+        return conn
+
+    @contextmanager
+    def _get_connection(self):
+        """Get database connection, reusing the request-scoped one when active."""
+        if getattr(self._scope, 'active', False):
+            conn = getattr(self._scope, 'conn', None)
+            if conn is None:
+                conn = self._scope.conn = self._connect()
+            try:
+                yield conn
+            except Exception:
+                # Don't leak a half-finished transaction into the next query
+                conn.rollback()
+                raise
+            return
+        conn = self._connect()
         try:
             yield conn
         finally:
             conn.close()
-    
+
+    def begin_request_scope(self):
+        """Share one lazily opened connection across queries on this thread."""
+        self._scope.active = True
+
+    def end_request_scope(self):
+        """Close the request-scoped connection, if one was opened."""
+        self._scope.active = False
+        conn = getattr(self._scope, 'conn', None)
+        self._scope.conn = None
+        if conn is not None:
+            conn.close()
+
     def _log_slow_query(self, query: str, execution_time: float):
         """Log queries that take longer than 100ms."""
         # Disabled - slow query logging was too noisy
@@ -85,6 +122,22 @@ class DatabaseManager:
             log_exception(e)
             raise DatabaseError(f"Failed to create session: {e}")
     
+    def ensure_session(self, session_id: str) -> bool:
+        """Create the session row if missing; a no-op write when it already exists."""
+        try:
+            start_time = time.time()
+            with self._get_connection() as conn:
+                conn.execute(
+                    "INSERT OR IGNORE INTO sessions (session_id) VALUES (?)",
+                    (session_id,)
+                )
+                conn.commit()
+            self._log_slow_query("ensure_session", time.time() - start_time)
+            return True
+        except Exception as e:
+            log_exception(e)
+            raise DatabaseError(f"Failed to ensure session: {e}")
+    
     def get_simulation(self, sim_id: int) -> Optional[Dict[str, Any]]:
         """Get simulation by ID with optimized query."""
         try:
@@ -101,6 +154,32 @@ class DatabaseManager:
             log_exception(e)
             raise DatabaseError(f"Failed to get simulation: {e}")
     
+    def get_simulation_with_logs(self, sim_id: int) -> Dict[str, Any]:
+        """Get a simulation row and its combat logs over a single connection."""
+        try:
+            start_time = time.time()
+            with self._get_connection() as conn:
+                sim = conn.execute(
+                    "SELECT * FROM simulations WHERE id = ?",
+                    (sim_id,)
+                ).fetchone()
+                logs = conn.execute(
+                    """
+                    SELECT * FROM combat_logs 
+                    WHERE simulation_id = ? 
+                    ORDER BY round_number, action_order
+                    """,
+                    (sim_id,)
+                ).fetchall()
+            self._log_slow_query("get_simulation_with_logs", time.time() - start_time)
+            return {
+                'simulation': dict(sim) if sim else None,
+                'logs': [dict(row) for row in logs]
+            }
+        except Exception as e:
+            log_exception(e)
+            raise DatabaseError(f"Failed to get simulation with logs: {e}")
+
     def get_simulation_history(self, session_id: str) -> List[Dict[str, Any]]:
         """Get simulation history with optimized query and pagination."""
         try:
@@ -147,7 +226,8 @@ class DatabaseManager:
             log_exception(e)
             raise DatabaseError(f"Failed to get last simulation ID: {e}")
 
-    def _convert_combat_log_format(self, logs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    @staticmethod
+    def _convert_combat_log_format(logs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Convert combat log from simulation format to database format."""
         converted_logs = []
         action_order = 0
@@ -255,53 +335,105 @@ class DatabaseManager:
         
         return converted_logs
 
+    @staticmethod
+    def combat_log_rows(logs: List[Dict[str, Any]]) -> List[Tuple]:
+        """Convert a simulation log into combat_logs row tuples (without the simulation ID)."""
+        return [
+            (log.get('round_number', 0), log.get('action_order', 0),
+             log.get('character_name', ''), log.get('action_type', ''),
+             log.get('target', ''), str(log.get('result', '')), log.get('damage', 0))
+            for log in DatabaseManager._convert_combat_log_format(logs)
+        ]
+
+    def _insert_simulation_row(self, conn: sqlite3.Connection, session_id: str, result: Dict[str, Any]) -> int:
+        """Insert one simulation row (without its combat logs) on an open connection; returns its ID."""
+        cursor = conn.execute(
+            """
+            INSERT INTO simulations (session_id, party_level, encounter_type, result, rounds, party_hp_remaining)
+            VALUES (?, ?, ?, ?, ?, ?)
+            """,
+            (
+                session_id,
+                result.get('party_level', 1),
+                result.get('encounter_type', 'custom'),
+                str(result.get('winner', 'unknown')),
+                result.get('rounds', 0),
+                result.get('party_hp_remaining', 0)
+            )
+        )
+        return cursor.lastrowid
+
+    def _combat_log_data(self, sim_id: int, result: Dict[str, Any]) -> List[tuple]:
+        """Build combat_logs insert tuples for a result; results may arrive with rows already built."""
+        log_rows = result.get('log_rows')
+        if log_rows is None:
+            log_rows = self.combat_log_rows(result.get('log', []))
+        return [(sim_id,) + tuple(row) for row in log_rows]
+
+    def _insert_combat_logs(self, conn: sqlite3.Connection, log_data: List[tuple]) -> None:
+        """Batch insert combat_logs tuples on an open connection."""
+        if log_data:
+            conn.executemany(
+                """
+                INSERT INTO combat_logs 
+                (simulation_id, round_number, action_order, character_name, action_type, target, result, damage)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                log_data
+            )
+
+    def _insert_simulation(self, conn: sqlite3.Connection, session_id: str, result: Dict[str, Any]) -> int:
+        """Insert one simulation and its combat logs on an open connection; returns the simulation ID."""
+        sim_id = self._insert_simulation_row(conn, session_id, result)
+        self._insert_combat_logs(conn, self._combat_log_data(sim_id, result))
+        return sim_id
+
     def save_simulation_result(self, session_id: str, result: Dict[str, Any]) -> int:
         """Save simulation result with optimized batch insert."""
         try:
             start_time = time.time()
             with self._get_connection() as conn:
-                # Insert simulation
-                cursor = conn.execute(
+                sim_id = self._insert_simulation(conn, session_id, result)
+                conn.commit()
+            self._log_slow_query("save_simulation_result", time.time() - start_time)
+            return sim_id
+        except Exception as e:
+            log_exception(e)
+            raise DatabaseError(f"Failed to save simulation result: {e}")
+
+    def save_batch_runs(self, session_id: str, batch_id: int, runs: List[Tuple[int, Dict[str, Any]]]) -> List[int]:
+        """Save many (run_number, result) pairs and their batch rows in one transaction."""
+        try:
+            start_time = time.time()
+            with self._get_connection() as conn:
+                sim_ids = []
+                run_rows = []
+                log_data = []
+                for run_number, result in runs:
+                    sim_id = self._insert_simulation_row(conn, session_id, result)
+                    sim_ids.append(sim_id)
+                    log_data.extend(self._combat_log_data(sim_id, result))
+                    run_rows.append((
+                        batch_id, sim_id, run_number,
+                        result.get('winner', 'unknown'),
+                        result.get('rounds', 0),
+                        result.get('party_hp_remaining', 0)
+                    ))
+                # One executemany for every run's combat logs instead of one per run
+                self._insert_combat_logs(conn, log_data)
+                conn.executemany(
                     """
-                    INSERT INTO simulations (session_id, party_level, encounter_type, result, rounds, party_hp_remaining)
+                    INSERT INTO batch_simulation_runs (batch_id, simulation_id, run_number, result, rounds, party_hp_remaining)
                     VALUES (?, ?, ?, ?, ?, ?)
                     """,
-                    (
-                        session_id,
-                        result.get('party_level', 1),
-                        result.get('encounter_type', 'custom'),
-                        str(result.get('winner', 'unknown')),
-                        result.get('rounds', 0),
-                        result.get('party_hp_remaining', 0)
-                    )
+                    run_rows
                 )
-                sim_id = cursor.lastrowid
-                
-                # Convert and batch insert combat logs
-                logs = result.get('log', [])
-                if logs:
-                    converted_logs = self._convert_combat_log_format(logs)
-                    log_data = [
-                        (sim_id, log.get('round_number', 0), log.get('action_order', 0),
-                         log.get('character_name', ''), log.get('action_type', ''),
-                         log.get('target', ''), str(log.get('result', '')), log.get('damage', 0))
-                        for log in converted_logs
-                    ]
-                    conn.executemany(
-                        """
-                        INSERT INTO combat_logs 
-                        (simulation_id, round_number, action_order, character_name, action_type, target, result, damage)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                        """,
-                        log_data
-                    )
-                
                 conn.commit()
-            self._log_slow_query("save_simulation_result", time.time() - start_time)
-            return sim_id
+            self._log_slow_query("save_batch_runs", time.time() - start_time)
+            return sim_ids
         except Exception as e:
             log_exception(e)
-            raise DatabaseError(f"Failed to save simulation result: {e}")
+            raise DatabaseError(f"Failed to save batch runs: {e}")
     
     def cleanup_old_sessions(self, days_old: int = 7) -> int:
         """Clean up old sessions and related data."""
@@ -343,6 +475,29 @@ class DatabaseManager:
             log_exception(e)
             raise DatabaseError(f"Failed to get combat logs: {e}")
 
+    def iter_combat_logs(self, sim_id: int, batch_size: int = FETCH_BATCH_SIZE) -> Iterator[Dict[str, Any]]:
+        """Yield combat logs for a simulation without materializing the full result set."""
+        try:
+            with self._get_connection() as conn:
+                cursor = conn.execute(
+                    """
+                    SELECT * FROM combat_logs 
+                    WHERE simulation_id = ? 
+                    ORDER BY round_number, action_order
+                    """,
+                    (sim_id,)
+                )
+                cursor.arraysize = batch_size
+                while True:
+                    rows = cursor.fetchmany()
+                    if not rows:
+                        break
+                    for row in rows:
+                        yield dict(row)
+        except Exception as e:
+            log_exception(e)
+            raise DatabaseError(f"Failed to iterate combat logs: {e}")
+
     def save_combat_log(self, sim_id: int, round_number: int, action_order: int, character_name: str, action_type: str, target: str, result: str, damage: int) -> int:
         """Legacy method for backward compatibility with tests."""
         try:
@@ -443,6 +598,42 @@ class DatabaseManager:
             log_exception(e)
             raise DatabaseError(f"Failed to update batch statistics: {e}")
 
+    def update_batch_statistics_from_runs(self, batch_id: int) -> Dict[str, Any]:
+        """Recompute batch statistics from its saved runs in SQL and return them."""
+        try:
+            start_time = time.time()
+            with self._get_connection() as conn:
+                conn.execute(
+                    """
+                    UPDATE batch_simulations
+                    SET (total_runs, party_wins, monster_wins, average_rounds, average_party_hp_remaining) = (
+                        SELECT COUNT(*),
+                               COALESCE(SUM(result = 'party'), 0),
+                               COALESCE(SUM(result != 'party'), 0),
+                               COALESCE(AVG(rounds), 0),
+                               COALESCE(AVG(party_hp_remaining), 0)
+                        FROM batch_simulation_runs
+                        WHERE batch_id = ?
+                    )
+                    WHERE id = ?
+                    """,
+                    (batch_id, batch_id)
+                )
+                cursor = conn.execute(
+                    """
+                    SELECT total_runs, party_wins, monster_wins, average_rounds, average_party_hp_remaining
+                    FROM batch_simulations WHERE id = ?
+                    """,
+                    (batch_id,)
+                )
+                row = cursor.fetchone()
+                conn.commit()
+            self._log_slow_query("update_batch_statistics_from_runs", time.time() - start_time)
+            return dict(row) if row else {}
+        except Exception as e:
+            log_exception(e)
+            raise DatabaseError(f"Failed to update batch statistics: {e}")
+
     def get_batch_simulation(self, batch_id: int) -> Optional[Dict[str, Any]]:
         """Get batch simulation by ID."""
         try:
@@ -0,0 +1,35 @@
+"""
+Dice randomness for D&D 5e Combat Simulator.
+
+Every roll draws from rng(): the random.Random a seeded combat installed for
+the current thread, or the process-wide random module otherwise.
+"""
+import random
+import threading
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+_current = threading.local()
+
+
+def rng():
+    """Return the generator this thread's dice rolls draw from."""
+    return getattr(_current, 'rng', None) or random
+
+
+@contextmanager
+def using(generator: Optional[random.Random]) -> Iterator[None]:
+    """
+    Draw this thread's dice from generator until the block exits.
+
+    A seeded run keeps its own stream this way, so it replays the same no
+    matter what other simulations roll meanwhile. None leaves the current
+    source in place.
+    """
+    previous = getattr(_current, 'rng', None)
+    if generator is not None:
+        _current.rng = generator
+    try:
+        yield
+    finally:
+        _current.rng = previous
@@ -88,6 +88,28 @@ class Monster:
                 )
             ]
     
+    def clone(self) -> 'Monster':
+        """
+        Create a fresh copy of this monster for a new combat.
+        
+        Actions and other stat block data are shared with the original;
+        hit points and buffs are reset.
+        
+        Returns:
+            Monster: A full-health copy with no buffs
+        """
+        # Skip __init__ and copy.copy's reduce protocol; only the attributes are needed
+        clone = object.__new__(type(self))
+        clone.__dict__.update(self.__dict__)
+        clone.buffs = BuffManager()
+        clone.reset_combat_state()
+        return clone
+    
+    def reset_combat_state(self) -> None:
+        """Restore full hit points and drop all buffs, ready for another combat."""
+        self.hp = self.max_hp
+        self.buffs.clear_all()
+    
     def ability_modifier(self, ability: str) -> int:
         """
         Calculate the modifier for a given ability score.
@@ -152,8 +174,8 @@ class Monster:
         """
         Roll initiative: 1d20 + dex modifier.
         """
-        import random
-        return random.randint(1, 20) + self.ability_modifier('dex')
+        from models.dice import rng
+        return rng().randint(1, 20) + self.ability_modifier('dex')
 
     def is_alive(self) -> bool:
         """
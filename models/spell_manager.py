@@ -4,14 +4,64 @@ Spell Manager for D&D 5e Combat Simulator.
 Handles loading and managing spells from JSON data files.
 """
 
+import functools
 import json
 import os
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from models.spells import Spell
 from utils.exceptions import APIError, ValidationError
 from utils.logging import log_exception
 
 
+@functools.lru_cache(maxsize=None)
+def _read_spell_catalogue(spells_file: str) -> Tuple[Dict[str, Spell], Dict[int, List[Spell]]]:
+    """
+    Parse a spells file once per process into (spells by name, spells by level).
+
+    Spell objects are read-only content data, so every SpellManager in the
+    process shares them; a failed read raises and is not cached.
+    """
+    with open(spells_file, 'r') as f:
+        data = json.load(f)
+
+    spells: Dict[str, Spell] = {}
+    spells_by_level: Dict[int, List[Spell]] = {}
+
+    # Cantrips first, then leveled spells 1-9
+    level_keys = [(0, 'cantrips')] + [(level, f'level_{level}') for level in range(1, 10)]
+    for level, level_key in level_keys:
+        for spell_data in data.get(level_key, []):
+            spell = _spell_from_data(spell_data)
+            spells[spell.name] = spell
+            spells_by_level.setdefault(level, []).append(spell)
+    return spells, spells_by_level
+
+
+def _spell_from_data(spell_data: Dict) -> Spell:
+    """Create a Spell object from dictionary data."""
+    return Spell(
+        name=spell_data['name'],
+        level=spell_data['level'],
+        school=spell_data['school'],
+        casting_time=spell_data['casting_time'],
+        range=spell_data['range'],
+        duration=spell_data['duration'],
+        components=spell_data['components'],
+        damage_dice=spell_data.get('damage_dice'),
+        damage_type=spell_data.get('damage_type'),
+        save_type=spell_data.get('save_type'),
+        save_dc_bonus=spell_data.get('save_dc_bonus', 0),
+        description=spell_data.get('description', ''),
+        is_attack_spell=spell_data.get('is_attack_spell', False),
+        healing=spell_data.get('healing', False),
+        area_effect=spell_data.get('area_effect', False),
+        concentration=spell_data.get('concentration', False),
+        is_buff_spell=spell_data.get('is_buff_spell', False),
+        buff_data=spell_data.get('buff_data'),
+        max_targets=spell_data.get('max_targets', 1)
+    )
+
+
 class SpellManager:
     """
     Manages spell loading and provides utility methods for spell operations.
@@ -34,28 +84,10 @@ class SpellManager:
         Load spells from the JSON file.
         """
         try:
-            with open(self.spells_file, 'r') as f:
-                data = json.load(f)
-            
-            # Load cantrips
-            for spell_data in data.get('cantrips', []):
-                spell = self._create_spell_from_data(spell_data)
-                self.spells[spell.name] = spell
-                if 0 not in self.spells_by_level:
-                    self.spells_by_level[0] = []
-                self.spells_by_level[0].append(spell)
-            
-            # Load leveled spells
-            for level in range(1, 10):  # Levels 1-9
-                level_key = f'level_{level}'
-                if level_key in data:
-                    for spell_data in data[level_key]:
-                        spell = self._create_spell_from_data(spell_data)
-                        self.spells[spell.name] = spell
-                        if level not in self.spells_by_level:
-                            self.spells_by_level[level] = []
-                        self.spells_by_level[level].append(spell)
-                        
+            spells, spells_by_level = _read_spell_catalogue(self.spells_file)
+            self.spells.update(spells)
+            for level, level_spells in spells_by_level.items():
+                self.spells_by_level.setdefault(level, []).extend(level_spells)
         except FileNotFoundError as e:
             log_exception(e)
             raise APIError(f"Spells file not found: {self.spells_file}")
@@ -76,27 +108,7 @@ class SpellManager:
         Returns:
             Spell: The created Spell object
         """
-        return Spell(
-            name=spell_data['name'],
-            level=spell_data['level'],
-            school=spell_data['school'],
-            casting_time=spell_data['casting_time'],
-            range=spell_data['range'],
-            duration=spell_data['duration'],
-            components=spell_data['components'],
-            damage_dice=spell_data.get('damage_dice'),
-            damage_type=spell_data.get('damage_type'),
-            save_type=spell_data.get('save_type'),
-            save_dc_bonus=spell_data.get('save_dc_bonus', 0),
-            description=spell_data.get('description', ''),
-            is_attack_spell=spell_data.get('is_attack_spell', False),
-            healing=spell_data.get('healing', False),
-            area_effect=spell_data.get('area_effect', False),
-            concentration=spell_data.get('concentration', False),
-            is_buff_spell=spell_data.get('is_buff_spell', False),
-            buff_data=spell_data.get('buff_data'),
-            max_targets=spell_data.get('max_targets', 1)
-        )
+        return _spell_from_data(spell_data)
     
     def get_spell(self, spell_name: str) -> Optional[Spell]:
         """
@@ -110,6 +122,19 @@ class SpellManager:
         """
         return self.spells.get(spell_name)
     
+    def get_spells(self, spell_names: List[str]) -> List[Spell]:
+        """
+        Get the spells for a list of names, in order, skipping unknown names.
+        
+        Args:
+            spell_names: The names of the spells
+            
+        Returns:
+            List[Spell]: The spells that were found
+        """
+        spells = self.spells
+        return [spells[name] for name in spell_names if name in spells]
+    
     def get_spells_by_level(self, level: int) -> List[Spell]:
         """
         Get all spells of a specific level.
@@ -5,17 +5,41 @@ Defines the Spell class and SpellAction subclass for spell casting in combat.
 """
 
 from typing import Dict, List, Optional, Any, TYPE_CHECKING
-import random
+import functools
 
-from models.actions import Action
+from models.actions import Action, combatant_name
 from utils.api_client import APIClient
 from utils.exceptions import APIError
+from models.dice import rng
 
 if TYPE_CHECKING:
     from models.character import Character
     from models.monster import Monster
 
 
+@functools.lru_cache(maxsize=256)
+def _parse_spell_dice(dice: str):
+    """
+    Parse dice notation with optional modifier (e.g., "1d4+1", "2d6", "8d6-2")
+    into (num, die, modifier). Cached because every cast re-rolls the same strings.
+    """
+    dice_str = dice.lower()
+    modifier = 0
+
+    # Extract modifier if present
+    if '+' in dice_str:
+        dice_part, mod_part = dice_str.split('+')
+        modifier = int(mod_part)
+        dice_str = dice_part
+    elif '-' in dice_str and not dice_str.startswith('-'):
+        dice_part, mod_part = dice_str.rsplit('-', 1)
+        modifier = -int(mod_part)
+        dice_str = dice_part
+
+    num, die = dice_str.split('d')
+    return int(num), int(die), modifier
+
+
 class Spell:
     """
     Represents a D&D 5e spell with all its properties and effects.
@@ -118,24 +142,9 @@ class Spell:
         else:
             dice = self.damage_dice
 
-        # Parse dice notation with optional modifier (e.g., "1d4+1", "2d6", "8d6-2")
-        dice_str = dice.lower()
-        modifier = 0
-
-        # Extract modifier if present
-        if '+' in dice_str:
-            dice_part, mod_part = dice_str.split('+')
-            modifier = int(mod_part)
-            dice_str = dice_part
-        elif '-' in dice_str and not dice_str.startswith('-'):
-            dice_part, mod_part = dice_str.rsplit('-', 1)
-            modifier = -int(mod_part)
-            dice_str = dice_part
-
-        num, die = dice_str.split('d')
-        num = int(num)
-        die = int(die)
-        rolls = [random.randint(1, die) for _ in range(num)]
+        num, die, modifier = _parse_spell_dice(dice)
+        randint = rng().randint
+        rolls = [randint(1, die) for _ in range(num)]
         return sum(rolls) + modifier
 
     def get_save_dc(self, caster: Any) -> int:
@@ -271,7 +280,7 @@ class SpellAction(Action):
                 'success': False,
                 'reason': 'No spell slot available',
                 'description': self.description,
-                'target': getattr(target, 'name', str(target))
+                'target': combatant_name(target)
             }
         
         if not self.consume_spell_slot(caster):
@@ -280,18 +289,18 @@ class SpellAction(Action):
                 'success': False,
                 'reason': 'Failed to consume spell slot',
                 'description': self.description,
-                'target': getattr(target, 'name', str(target))
+                'target': combatant_name(target)
             }
 
         # Get target name(s) for result
         if isinstance(target, list):
-            target_names = [getattr(t, 'name', str(t)) for t in target]
+            target_names = [combatant_name(t) for t in target]
         else:
-            target_names = getattr(target, 'name', str(target))
+            target_names = combatant_name(target)
 
         result = {
             'action': self.name,
-            'caster': getattr(caster, 'name', str(caster)),
+            'caster': combatant_name(caster),
             'spell': self.spell.name,
             'spell_level': self.spell.level,
             'success': True,
@@ -310,7 +319,7 @@ class SpellAction(Action):
                 # Create a separate buff instance for each target
                 buff = Buff(
                     name=self.spell.buff_data.get('name', self.spell.name),
-                    source=getattr(caster, 'name', str(caster)),
+                    source=combatant_name(caster),
                     duration_rounds=self.spell.buff_data.get('duration_rounds', -1),
                     bonus_dice=self.spell.buff_data.get('bonus_dice'),
                     bonus_static=self.spell.buff_data.get('bonus_static', 0),
@@ -322,7 +331,7 @@ class SpellAction(Action):
                 # Apply buff to this target
                 if hasattr(t, 'buffs'):
                     t.buffs.add_buff(buff)
-                    buffs_applied.append(getattr(t, 'name', str(t)))
+                    buffs_applied.append(combatant_name(t))
 
             result.update({
                 'buff_applied': len(buffs_applied) > 0,
@@ -363,7 +372,7 @@ class SpellAction(Action):
                 base_healing = self._get_healing_amount(caster) if self.spell.healing else 0
 
                 for t in targets_list:
-                    attack_roll = random.randint(1, 20)
+                    attack_roll = rng().randint(1, 20)
                     total_attack = attack_roll + attack_bonus + buff_bonus
                     target_ac = getattr(t, 'ac', 10)
                     hit = total_attack >= target_ac
@@ -372,7 +381,7 @@ class SpellAction(Action):
                         if self.spell.healing:
                             t.hp = min(t.hp + base_healing, getattr(t, 'max_hp', t.hp))
                             target_results.append({
-                                'target': getattr(t, 'name', str(t)),
+                                'target': combatant_name(t),
                                 'attack_roll': attack_roll,
                                 'total_attack': total_attack,
                                 'target_ac': target_ac,
@@ -384,7 +393,7 @@ class SpellAction(Action):
                             t.hp -= base_damage
                             total_damage_dealt += base_damage
                             target_results.append({
-                                'target': getattr(t, 'name', str(t)),
+                                'target': combatant_name(t),
                                 'attack_roll': attack_roll,
                                 'total_attack': total_attack,
                                 'target_ac': target_ac,
@@ -394,7 +403,7 @@ class SpellAction(Action):
                             })
                     else:
                         target_results.append({
-                            'target': getattr(t, 'name', str(t)),
+                            'target': combatant_name(t),
                             'attack_roll': attack_roll,
                             'total_attack': total_attack,
                             'target_ac': target_ac,
@@ -413,7 +422,7 @@ class SpellAction(Action):
 
             else:
                 # Single target attack spell
-                attack_roll = random.randint(1, 20)
+                attack_roll = rng().randint(1, 20)
                 if hasattr(caster, 'spell_attack_bonus'):
                     attack_bonus = caster.spell_attack_bonus()
                 else:
@@ -473,7 +482,7 @@ class SpellAction(Action):
                 base_damage = self.spell.calculate_damage(getattr(caster, 'level', 1))
 
                 for t in targets_list:
-                    save_roll = random.randint(1, 20)
+                    save_roll = rng().randint(1, 20)
 
                     # Calculate save bonus
                     if hasattr(t, 'saving_throw_bonus'):
@@ -499,7 +508,7 @@ class SpellAction(Action):
                     total_damage_dealt += damage
 
                     target_results.append({
-                        'target': getattr(t, 'name', str(t)),
+                        'target': combatant_name(t),
                         'save_roll': save_roll,
                         'save_bonus': save_bonus,
                         'buff_bonus': buff_bonus,
@@ -520,7 +529,7 @@ class SpellAction(Action):
 
             else:
                 # Single target saving throw spell
-                save_roll = random.randint(1, 20)
+                save_roll = rng().randint(1, 20)
 
                 # Calculate save bonus
                 if hasattr(targets_list[0], 'saving_throw_bonus'):
@@ -579,7 +588,7 @@ class SpellAction(Action):
                         healing = self._get_healing_amount(caster)
                         t.hp = min(t.hp + healing, getattr(t, 'max_hp', t.hp))
                         target_results.append({
-                            'target': getattr(t, 'name', str(t)),
+                            'target': combatant_name(t),
                             'healing': healing,
                             'hp_after': t.hp
                         })
@@ -588,7 +597,7 @@ class SpellAction(Action):
                         t.hp -= damage
                         total_damage_dealt += damage
                         target_results.append({
-                            'target': getattr(t, 'name', str(t)),
+                            'target': combatant_name(t),
                             'damage': damage,
                             'hp_after': t.hp
                         })
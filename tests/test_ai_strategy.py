@@ -96,4 +96,14 @@ def test_no_valid_targets(monster_ai):
     monster = DummyCombatant('Zombie', 10, 10, actions=[DummyAction('attack')])
     combat_state = {'enemies': []}
     action = monster_ai.choose_action(monster, combat_state)
-    assert action['type'] == 'wait' 
\ No newline at end of file
+    assert action['type'] == 'wait' 
+
+
+def test_monster_targeting_is_deterministic_per_round():
+    enemies = [DummyCombatant(f'Hero{i}', 10 + i, 40) for i in range(4)]
+    monster = DummyCombatant('Orc', 15, 15)
+    for round_num in range(1, 30):
+        state = {'enemies': enemies, 'round': round_num}
+        first = MonsterAIStrategy()._select_target_with_strategy(monster, enemies, state)
+        again = MonsterAIStrategy()._select_target_with_strategy(monster, enemies, state)
+        assert first is again
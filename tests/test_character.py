@@ -267,4 +267,39 @@ class TestCharacter:
         # The original dictionary should not be modified
         assert self.standard_ability_scores == original_scores
         # The character's ability scores should be modified
-        assert self.character.ability_scores['str'] == 20 
\ No newline at end of file
+        assert self.character.ability_scores['str'] == 20 
+    
+    def test_clone_resets_combat_state(self):
+        """Test that clone() shares content but starts with fresh combat state."""
+        from models.buffs import Buff
+        self.character.spell_slots = {1: 2}
+        self.character.spell_slots_remaining = {1: 0}
+        self.character.hp = 3
+        self.character.buffs.add_buff(Buff(name="Bless", source="Cleric", bonus_dice="1d4", affects=['attack_rolls']))
+        
+        clone = self.character.clone()
+        
+        assert clone is not self.character
+        assert clone.hp == clone.max_hp == 45
+        assert clone.spell_slots_remaining == {1: 2}
+        assert clone.buffs.calculate_total_bonus('attack_rolls') == 0
+        assert clone.actions is self.character.actions
+        clone.hp -= 10
+        assert self.character.hp == 3
+        assert self.character.buffs.calculate_total_bonus('attack_rolls') > 0
+    
+    def test_reset_combat_state_reuses_character(self):
+        """Test that reset_combat_state() restores a used character in place."""
+        from models.buffs import Buff
+        self.character.spell_slots = {1: 2}
+        self.character.spell_slots_remaining = {1: 0}
+        self.character.hp = 0
+        self.character.buffs.add_buff(Buff(name="Bless", source="Cleric", bonus_dice="1d4", affects=['attack_rolls']))
+        buffs = self.character.buffs
+        
+        self.character.reset_combat_state()
+        
+        assert self.character.hp == 45
+        assert self.character.spell_slots_remaining == {1: 2}
+        assert self.character.buffs is buffs
+        assert self.character.buffs.calculate_total_bonus('attack_rolls') == 0
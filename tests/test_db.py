@@ -48,4 +48,73 @@ def test_save_and_get_combat_log(monkeypatch):
     logs = db.get_combat_logs(sim_id)
     assert len(logs) == 1
     assert logs[0]['character_name'] == 'Hero'
-    os.remove(db_path) 
\ No newline at end of file
+    os.remove(db_path) 
+
+
+def test_ensure_session_is_idempotent():
+    db_fd, db_path = tempfile.mkstemp()
+    os.close(db_fd)
+    db = DatabaseManager(db_path)
+    session_id = 'test-session-ensure'
+    db.create_session(session_id, selected_party_id=2)
+    assert db.ensure_session(session_id)
+    assert db.ensure_session('test-session-ensure-new')
+    with db._get_connection() as conn:
+        row = conn.execute("SELECT selected_party_id FROM sessions WHERE session_id = ?", (session_id,)).fetchone()
+        count = conn.execute("SELECT COUNT(*) FROM sessions").fetchone()[0]
+    assert row['selected_party_id'] == 2
+    assert count == 2
+    os.remove(db_path)
+
+def test_save_batch_runs_writes_simulations_and_runs():
+    db_fd, db_path = tempfile.mkstemp()
+    os.close(db_fd)
+    db = DatabaseManager(db_path)
+    session_id = 'test-session-batch'
+    db.create_session(session_id)
+    batch_id = db.create_batch_simulation(session_id, 'Bulk', 3, 'goblin')
+    runs = [
+        (1, {'winner': 'party', 'rounds': 3, 'party_hp_remaining': 20, 'log': []}),
+        (2, {'winner': 'monsters', 'rounds': 5, 'party_hp_remaining': 0, 'log': []}),
+    ]
+    sim_ids = db.save_batch_runs(session_id, batch_id, runs)
+    assert len(sim_ids) == 2
+    stored = db.get_batch_runs(batch_id)
+    assert sorted(r['run_number'] for r in stored) == [1, 2]
+    assert sorted(r['simulation_id'] for r in stored) == sorted(sim_ids)
+    os.remove(db_path)
+
+def test_update_batch_statistics_from_runs():
+    db_fd, db_path = tempfile.mkstemp()
+    os.close(db_fd)
+    db = DatabaseManager(db_path)
+    session_id = 'test-session-batch-stats'
+    db.create_session(session_id)
+    batch_id = db.create_batch_simulation(session_id, 'Stats', 3, 'goblin')
+    assert db.update_batch_statistics_from_runs(batch_id)['total_runs'] == 0
+    db.save_batch_runs(session_id, batch_id, [
+        (1, {'winner': 'party', 'rounds': 3, 'party_hp_remaining': 20, 'log': []}),
+        (2, {'winner': 'monsters', 'rounds': 5, 'party_hp_remaining': 0, 'log': []}),
+    ])
+    stats = db.update_batch_statistics_from_runs(batch_id)
+    assert stats == {'total_runs': 2, 'party_wins': 1, 'monster_wins': 1,
+                     'average_rounds': 4.0, 'average_party_hp_remaining': 10.0}
+    assert db.get_batch_simulation(batch_id)['average_rounds'] == 4.0
+    os.remove(db_path)
+
+def test_save_simulation_result_accepts_prebuilt_log_rows():
+    db_fd, db_path = tempfile.mkstemp()
+    os.close(db_fd)
+    db = DatabaseManager(db_path)
+    session_id = 'test-session-rows'
+    db.create_session(session_id)
+    log = [
+        {'type': 'round_start', 'round': 1},
+        {'type': 'action', 'actor': 'Hero', 'result': {'action': 'Longsword attack', 'target': 'Goblin', 'hit': True, 'damage': 6}},
+    ]
+    from_log = db.save_simulation_result(session_id, {'winner': 'party', 'rounds': 1, 'log': log})
+    from_rows = db.save_simulation_result(session_id, {'winner': 'party', 'rounds': 1, 'log_rows': DatabaseManager.combat_log_rows(log)})
+    strip = lambda rows: [{k: v for k, v in r.items() if k not in ('id', 'simulation_id', 'timestamp', 'created_at')} for r in rows]
+    assert strip(db.get_combat_logs(from_log)) == strip(db.get_combat_logs(from_rows))
+    assert db.get_combat_logs(from_rows)[0]['result'] == 'Hit for 6 damage'
+    os.remove(db_path)
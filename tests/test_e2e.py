@@ -1,11 +1,12 @@
 import pytest
-from app import app as flask_app
+from app import app as flask_app, cache
 from utils.exceptions import APIError, DatabaseError
 from utils.party_loader import PartyLoader
 
 @pytest.fixture
 def client():
     flask_app.config['TESTING'] = True
+    cache.clear()
     with flask_app.test_client() as client:
         with flask_app.app_context():
             yield client
@@ -80,7 +81,10 @@ def test_db_failure_recovery(client, monkeypatch):
     from models.db import DatabaseManager
     def fail_get_simulation(self, sim_id):
         raise DatabaseError('DB down')
+    def fail_get_simulation_with_logs(self, sim_id):
+        raise DatabaseError('DB down')
     monkeypatch.setattr(DatabaseManager, 'get_simulation', fail_get_simulation)
+    monkeypatch.setattr(DatabaseManager, 'get_simulation_with_logs', fail_get_simulation_with_logs)
     rv = client.get('/results?sim_id=1')
     assert rv.status_code == 400 or rv.status_code == 500
     assert b'error' in rv.data or b'Oops' in rv.data
@@ -1,9 +1,10 @@
 import pytest
-from app import app as flask_app
+from app import app as flask_app, cache
 
 @pytest.fixture
 def client():
     flask_app.config['TESTING'] = True
+    cache.clear()
     with flask_app.test_client() as client:
         with flask_app.app_context():
             yield client
@@ -125,4 +126,217 @@ def test_api_prebuilt_encounters():
         assert response.status_code == 200
         data = response.get_json()
         assert isinstance(data, list)
-        assert any('name' in enc for enc in data) 
\ No newline at end of file
+        assert any('name' in enc for enc in data)
+
+def test_sanitize_html_strips_dangerous_markup():
+    from app import sanitize_html
+    assert sanitize_html('Goblin hits Aldric') == 'Goblin hits Aldric'
+    assert sanitize_html('a<SCRIPT src=x>alert(1)</script>b') == 'ab'
+    assert sanitize_html('<iframe src="x">c') == 'c'
+    assert sanitize_html('<b onclick="evil()">x</b>') == '<b >x</b>'
+    assert sanitize_html('JavaScript:alert(1)') == 'alert(1)'
+    assert sanitize_html('a<SCRIPT >alert(1)</SCRIPT\n>b') == 'ab'
+    assert sanitize_html('a</script>b') == 'ab'
+    assert sanitize_html('<img onerror=alert(1)>') == '<img >'
+    assert sanitize_html("<b onclick='x\"y'>z</b>") == '<b >z</b>'
+    assert sanitize_html('javascript :alert(1)') == 'alert(1)'
+    assert sanitize_html('<scripture>') == '<scripture>'
+
+def test_validate_input_patterns():
+    from app import validate_input
+    from utils.exceptions import ValidationError
+    assert validate_input({'cr': '1/4', 'template_name': "Orc's Den"})
+    with pytest.raises(ValidationError):
+        validate_input({'cr': '1/4a'})
+    with pytest.raises(ValidationError):
+        validate_input({'name': "<b>"})
+
+def test_sanitize_html_batch_matches_per_entry():
+    from app import sanitize_html, sanitize_html_batch
+    entries = [
+        'Aldric hits Goblin for 5 damage',
+        {'character_name': '<script>x</script>Kobold', 'damage': 3},
+        'opens <script> here',
+        'closes </script> here',
+        '',
+    ]
+    assert sanitize_html_batch(entries) == [sanitize_html(str(e)) for e in entries]
+    assert sanitize_html_batch([]) == []
+
+def test_results_detailed_streams_ndjson(client):
+    import json
+    from app import db
+    client.get('/')
+    with client.session_transaction() as sess:
+        session_id = sess['session_id']
+    db.ensure_session(session_id)
+    sim_id = db.save_simulation_result(session_id, {'winner': 'party', 'rounds': 1, 'log': [
+        {'type': 'round_start', 'round': 1},
+        {'type': 'action', 'actor': 'Aldric', 'result': {'action': 'Longsword attack', 'target': 'Goblin', 'hit': True, 'damage': 5}},
+        {'type': 'action', 'actor': 'Goblin', 'result': {'action': 'Scimitar attack', 'target': 'Aldric', 'hit': False}},
+    ]})
+    with client.session_transaction() as sess:
+        sess['simulation_id'] = sim_id
+    rv = client.get('/results/detailed')
+    assert rv.status_code == 200
+    assert rv.mimetype == 'application/x-ndjson'
+    lines = [json.loads(line) for line in rv.data.decode().splitlines()]
+    assert len(lines) == 2
+    assert 'Aldric' in lines[0]
+
+def test_request_reuses_one_db_connection(monkeypatch):
+    from app import db
+    flask_app.config['TESTING'] = True
+    client = flask_app.test_client()
+    opened = []
+    real_connect = db._connect
+    def counting_connect():
+        conn = real_connect()
+        opened.append(conn)
+        return conn
+    monkeypatch.setattr(db, '_connect', counting_connect)
+    client.get('/')
+    opened.clear()
+    rv = client.get('/history')
+    assert rv.status_code == 200
+    assert len(opened) == 1
+    assert db._scope.conn is None
+
+def test_error_handler_content_negotiation(client):
+    client.get('/')
+    with client.session_transaction() as sess:
+        sess['simulation_id'] = -1
+    rv = client.get('/results/statistics', headers={'Accept': 'application/json'})
+    assert rv.status_code == 400
+    assert rv.get_json()['type'] == 'ValidationError'
+    rv = client.get('/results/statistics', headers={'Accept': 'text/html,application/json'})
+    assert rv.status_code == 400
+    assert not rv.is_json
+
+def test_results_export_is_compact_json(client):
+    import json
+    from app import db
+    client.get('/')
+    with client.session_transaction() as sess:
+        session_id = sess['session_id']
+    db.ensure_session(session_id)
+    sim_id = db.save_simulation_result(session_id, {'winner': 'party', 'rounds': 1, 'log': [
+        {'type': 'action', 'actor': 'Aldric', 'result': {'action': 'Longsword attack', 'target': 'Goblin', 'hit': True, 'damage': 5}},
+    ]})
+    with client.session_transaction() as sess:
+        sess['simulation_id'] = sim_id
+    rv = client.get('/results/export')
+    assert rv.status_code == 200
+    assert rv.mimetype == 'application/json'
+    data = json.loads(rv.data)
+    assert data['simulation']['id'] == sim_id
+    assert rv.data == json.dumps(data, separators=(',', ':')).encode()
+
+def test_results_endpoints_fall_back_to_last_simulation(client):
+    from app import db
+    client.get('/')
+    with client.session_transaction() as sess:
+        session_id = sess['session_id']
+    db.ensure_session(session_id)
+    sim_id = db.save_simulation_result(session_id, {'winner': 'party', 'rounds': 1, 'log': [
+        {'type': 'action', 'actor': 'Aldric', 'result': {'action': 'Longsword attack', 'target': 'Goblin', 'hit': True, 'damage': 5}},
+    ]})
+    rv = client.get('/results/export')
+    assert rv.get_json()['simulation']['id'] == sim_id
+    rv = client.get(f'/results/export?sim_id={sim_id}')
+    assert rv.get_json()['simulation']['id'] == sim_id
+
+def test_repeat_results_request_is_served_from_cache(monkeypatch):
+    # Use the live module: test_deployment reloads app, leaving flask_app with
+    # view functions memoized on a cache registered to the reloaded app only
+    import app
+    db = app.db
+    app.cache.clear()
+    client = app.app.test_client()
+    client.get('/')
+    with client.session_transaction() as sess:
+        session_id = sess['session_id']
+    db.ensure_session(session_id)
+    sim_id = db.save_simulation_result(session_id, {'winner': 'party', 'rounds': 1, 'log': [
+        {'type': 'action', 'actor': 'Aldric', 'result': {'action': 'Longsword attack', 'target': 'Goblin', 'hit': True, 'damage': 5}},
+    ]})
+    lookups = []
+    real_lookup = db.get_simulation_with_logs
+    def counting_lookup(lookup_id):
+        lookups.append(lookup_id)
+        return real_lookup(lookup_id)
+    monkeypatch.setattr(db, 'get_simulation_with_logs', counting_lookup)
+    first = client.get(f'/results?sim_id={sim_id}')
+    second = client.get(f'/results?sim_id={sim_id}')
+    assert first.status_code == second.status_code == 200
+    assert b'Aldric' in second.data
+    assert lookups == [sim_id]
+
+def test_oversized_json_body_is_refused_unread(client):
+    import io
+    from app import MAX_JSON_BODY_BYTES
+
+    class UnreadableBody(io.RawIOBase):
+        def readable(self):
+            return True
+
+        def seekable(self):
+            return True
+
+        def seek(self, offset, whence=io.SEEK_SET):
+            return 0
+
+        def readinto(self, buffer):
+            pytest.fail('oversized body was read')
+
+    rv = client.post('/encounter/custom', input_stream=UnreadableBody(), content_type='application/json',
+                     environ_overrides={'CONTENT_LENGTH': str(MAX_JSON_BODY_BYTES + 1)})
+    assert rv.status_code == 400
+    assert 'too large' in rv.get_json()['error']
+
+def test_templates_preloaded_but_reload_follows_debug():
+    assert flask_app.config['TEMPLATES_AUTO_RELOAD'] is None
+    assert flask_app.jinja_env.cache
+    debug = flask_app.debug
+    try:
+        # As app.run(debug=True) does after import
+        flask_app.debug = True
+        assert flask_app.jinja_env.auto_reload
+    finally:
+        flask_app.debug = debug
+
+def test_healthz_skips_session_setup(monkeypatch):
+    from app import db
+    flask_app.config['TESTING'] = True
+    client = flask_app.test_client()
+    monkeypatch.setattr(db, '_connect', lambda: pytest.fail('healthz touched the database'))
+    rv = client.get('/healthz')
+    assert rv.status_code == 200
+    assert 'Set-Cookie' not in rv.headers
+
+def test_batch_start_rejects_non_integer_seed(client):
+    client.get('/')
+    rv = client.post('/batch/start', json={'num_runs': 10, 'seed': 'abc'})
+    assert rv.status_code == 400
+    assert 'seed must be an integer' in rv.get_json()['error']
+
+def test_controllers_share_app_managers():
+    from app import db, spell_manager, simulation_controller, batch_simulation_controller, results_controller
+    assert simulation_controller.db is db
+    assert batch_simulation_controller.db is db
+    assert results_controller.db is db
+    assert simulation_controller.spell_manager is spell_manager
+    assert batch_simulation_controller.spell_manager is spell_manager
+
+def test_prebuilt_encounter_stores_only_template_name(client):
+    from app import encounter_controller, load_monsters_from_session
+    template_name = encounter_controller.templates[0]['name']
+    rv = client.post('/encounter/prebuilt', json={'template_name': template_name, 'party_level': 3, 'party_size': 4})
+    assert rv.status_code == 200
+    with client.session_transaction() as sess:
+        assert 'encounter_monsters' not in sess
+        assert sess['selected_encounter'] == template_name
+    with flask_app.test_request_context():
+        from flask import session
+        session['selected_encounter'] = template_name
+        assert load_monsters_from_session() == rv.get_json()['monsters']
@@ -8,7 +8,7 @@ They are designed to catch object serialization bugs that unit tests might miss.
 import pytest
 import time
 import uuid
-from app import app as flask_app
+from app import app as flask_app, cache
 from models.combat import Combat
 from models.character import Character
 from models.monster import Monster
@@ -21,6 +21,7 @@ from utils.party_loader import PartyLoader
 def client():
     """Create a test client for the Flask app."""
     flask_app.config['TESTING'] = True
+    cache.clear()
     with flask_app.test_client() as client:
         with flask_app.app_context():
             yield client
@@ -0,0 +1,26 @@
+import json
+import pytest
+import utils.party_loader as party_loader
+from utils.party_loader import PartyLoader
+
+def test_has_party():
+    party_id = PartyLoader.load_parties()[0]['id']
+    assert PartyLoader.has_party(party_id)
+    assert not PartyLoader.has_party(999)
+
+def test_characters_for_level_returns_copies():
+    level = PartyLoader.get_available_levels()[0]
+    characters = PartyLoader.get_characters_for_level(level)
+    assert characters
+    characters[0]['name'] = 'Changed'
+    assert PartyLoader.get_characters_for_level(level)[0]['name'] != 'Changed'
+
+def test_read_json_file_with_and_without_orjson(monkeypatch, tmp_path):
+    path = tmp_path / 'data.json'
+    path.write_text('[{"level": 1, "party": []}]')
+    assert party_loader.read_json_file(str(path)) == [{'level': 1, 'party': []}]
+    monkeypatch.setattr(party_loader, 'orjson', None)
+    assert party_loader.read_json_file(str(path)) == [{'level': 1, 'party': []}]
+    path.write_text('[{')
+    with pytest.raises(json.JSONDecodeError):
+        party_loader.read_json_file(str(path))
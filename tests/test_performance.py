@@ -1,11 +1,12 @@
 import os
 import time
 import pytest
-from app import app as flask_app
+from app import app as flask_app, cache
 
 @pytest.fixture
 def client():
     flask_app.config['TESTING'] = True
+    cache.clear()
     with flask_app.test_client() as client:
         with flask_app.app_context():
             yield client
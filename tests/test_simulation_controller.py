@@ -0,0 +1,24 @@
+import pytest
+from controllers.simulation_controller import SimulationController
+from models.db import DatabaseManager
+
+@pytest.fixture
+def controller(tmp_path):
+    return SimulationController(db=DatabaseManager(str(tmp_path / 'simulation.db')))
+
+def test_character_lookup_uses_best_level(controller):
+    (name, char_class, level), char = next(iter(controller.character_cache.items()))
+    assert controller._load_full_character_data({'name': name, 'class': char_class, 'level': level}) is char
+    best = controller._load_full_character_data({'name': name, 'class': char_class, 'level': 99})
+    assert best['level'] == max(lvl for (n, c, lvl) in controller.character_cache if (n, c) == (name, char_class))
+    assert controller._load_full_character_data({'name': 'Nobody', 'class': 'None', 'level': 1}) is None
+
+def test_reuses_combatant_templates(controller):
+    party = [{'name': 'Nobody', 'class': 'Fighter', 'level': 3}]
+    monsters = [{'name': 'Goblin', 'hp': 7, 'ac': 13, 'cr': '1/4'}]
+    first = controller._build_combatants(party, monsters, 3)
+    first[0].hp = 0
+    second = controller._build_combatants(party, monsters, 3)
+    assert [c.name for c in second] == ['Nobody', 'Goblin']
+    assert second[0] is not first[0]
+    assert second[0].hp == second[0].max_hp
@@ -914,4 +914,21 @@ def test_spell_from_api_not_found(monkeypatch):
         def fetch_spell_data(self, name):
             return None
     with pytest.raises(APIError):
-        Spell.from_api('Nonexistent Spell', api_client=DummyAPIClient()) 
\ No newline at end of file
+        Spell.from_api('Nonexistent Spell', api_client=DummyAPIClient()) 
+
+
+def test_spell_managers_share_one_catalogue():
+    from models.spell_manager import SpellManager
+    first = SpellManager()
+    second = SpellManager()
+    assert len(first) == len(second) > 0
+    assert first.get_spell('Fireball') is second.get_spell('Fireball')
+    assert first.spells is not second.spells
+    assert first.get_spells_by_level(0) == second.get_spells_by_level(0)
+
+def test_spell_manager_get_spells_skips_unknown_names():
+    from models.spell_manager import SpellManager
+    manager = SpellManager()
+    spells = manager.get_spells(['Fireball', 'Not A Spell', 'Fireball'])
+    assert [spell.name for spell in spells] == ['Fireball', 'Fireball']
+    assert manager.get_spells([]) == []
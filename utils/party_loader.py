@@ -8,6 +8,13 @@ from typing import List, Dict, Any, Tuple
 from utils.exceptions import ValidationError
 from utils.logging import log_exception
 
+# orjson is an optional extra, not listed in requirements.txt: install it
+# alongside the app for faster data loading; stdlib json is used otherwise
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Constants
 PARTY_JSON_FILENAME = 'parties.json'
 CHARACTER_JSON_FILENAME = 'characters.json'
@@ -27,6 +34,20 @@ KEY_ID = 'id'
 logger = logging.getLogger(__name__)
 
 
+def read_json_file(path: str) -> Any:
+    """
+    Read and decode a JSON data file, using orjson when available.
+
+    Decode errors raise json.JSONDecodeError either way (orjson's error
+    type subclasses it).
+    """
+    with open(path, 'rb') as f:
+        raw = f.read()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
 class PartyLoader:
     """
     Utility class for loading and managing party data with caching.
@@ -38,6 +59,7 @@ class PartyLoader:
 
     # Class-level caches
     _parties_cache: List[Dict[str, Any]] = None
+    _party_index: Dict[int, Dict[str, Any]] = None  # party_id -> party
     _characters_cache: Dict[int, List[Dict[str, Any]]] = None  # level -> characters
     _character_index: Dict[Tuple[int, str, str], Dict[str, Any]] = None  # (level, name, class) -> character
     _cache_lock = threading.Lock()
@@ -103,8 +125,7 @@ class PartyLoader:
 
         try:
             logger.debug(f"Loading characters from {cls._character_json_path}")
-            with open(cls._character_json_path, 'r', encoding='utf-8') as f:
-                all_levels = json.load(f)
+            all_levels = read_json_file(cls._character_json_path)
 
             if not isinstance(all_levels, list):
                 raise ValidationError("Character data must be a list")
@@ -161,6 +182,27 @@ class PartyLoader:
         logger.debug(f"Built character index with {len(index)} entries")
         return index
 
+    @classmethod
+    def _build_party_index(cls) -> Dict[int, Dict[str, Any]]:
+        """
+        Build an indexed lookup table for O(1) party access.
+
+        Returns:
+            Dictionary mapping party ID to party data
+        """
+        if cls._parties_cache is None:
+            cls._parties_cache = cls._load_parties_from_disk()
+
+        index = {}
+        for party in cls._parties_cache:
+            party_id = party.get(KEY_ID)
+            # Keep the first party for a duplicated ID, matching the old linear scan
+            if party_id is not None and party_id not in index:
+                index[party_id] = party
+
+        logger.debug(f"Built party index with {len(index)} entries")
+        return index
+
     @classmethod
     def _ensure_caches_loaded(cls) -> None:
         """
@@ -170,6 +212,9 @@ class PartyLoader:
             if cls._parties_cache is None:
                 cls._parties_cache = cls._load_parties_from_disk()
 
+            if cls._party_index is None:
+                cls._party_index = cls._build_party_index()
+
             if cls._characters_cache is None:
                 cls._characters_cache = cls._load_characters_from_disk()
 
@@ -183,6 +228,7 @@ class PartyLoader:
         """
         with cls._cache_lock:
             cls._parties_cache = None
+            cls._party_index = None
             cls._characters_cache = None
             cls._character_index = None
 
@@ -278,18 +324,59 @@ class PartyLoader:
 
         logger.debug(f"Looking up party with ID {party_id}")
 
-        # Search for party
+        # O(1) lookup using index
         with cls._cache_lock:
-            for party in cls._parties_cache:
-                if party.get(KEY_ID) == party_id:
-                    logger.info(f"Found party with ID {party_id}: {party.get(KEY_NAME, 'Unknown')}")
-                    # Return deep copy to prevent external modifications
-                    return copy.deepcopy(party)
+            party = cls._party_index.get(party_id)
+            if party is not None:
+                logger.debug(f"Found party with ID {party_id}: {party.get(KEY_NAME, 'Unknown')}")
+                # Return deep copy to prevent external modifications
+                return copy.deepcopy(party)
 
         # Not found
         logger.warning(f"Party with ID {party_id} not found")
         raise ValidationError(f"Party with ID {party_id} not found")
 
+    @classmethod
+    def has_party(cls, party_id: int) -> bool:
+        """
+        Check whether a party exists without copying its data.
+
+        Args:
+            party_id: Unique identifier for the party
+
+        Returns:
+            True if a party with this ID is loaded, False otherwise
+
+        Raises:
+            ValidationError: If party_id is invalid
+        """
+        cls._validate_party_id(party_id)
+        cls._ensure_caches_loaded()
+
+        with cls._cache_lock:
+            return party_id in cls._party_index
+
+    @classmethod
+    def get_characters_for_level(cls, level: int) -> List[Dict[str, Any]]:
+        """
+        Get the full character data for one level from the cached characters file.
+
+        Args:
+            level: Character level (1-20)
+
+        Returns:
+            List of character dictionaries for that level (empty if the level has no data)
+
+        Raises:
+            ValidationError: If level is invalid or character data cannot be loaded
+        """
+        cls._validate_level(level)
+        cls._ensure_caches_loaded()
+
+        with cls._cache_lock:
+            # Return deep copy to prevent external modifications
+            return copy.deepcopy(cls._characters_cache.get(level, []))
+
     @classmethod
     def _lookup_character(
         cls,